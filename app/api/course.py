@@ -3,8 +3,11 @@ from fastapi import APIRouter, Query, Depends, HTTPException
 from supabase import Client
 from app.schemas.schemas import *
 from app.services.course_service import *
+from app.services.review_summary_service import get_review_summary_service
 from app.core.supabase_client import get_supabase
-from typing import Optional
+from app.core.geometry import MAX_ZOOM, GEOMETRY_POINTS
+from app.core.pagination import MAX_PAGE_SIZE
+from typing import Optional, List
 
 router = APIRouter()
 
@@ -31,33 +34,92 @@ def _parse_int_from_path(name: str, value: str) -> int:
     except Exception:
         raise HTTPException(status_code=400, detail=f"Path parameter '{name}' must be an integer. Received: {value}")
 
-@router.get("/courses", response_model=CourseListResponse)
-def get_courses(user_id: Optional[int] = Query(None), supabase: Client = Depends(get_supabase)):
+def _parse_int_list(name: str, value: str, max_items: int = MAX_PAGE_SIZE) -> List[int]:
+    """
+    "1,2,3" 형태의 쿼리 파라미터를 int 목록으로 변환.
+    DB 조회 URL이 지나치게 길어지지 않도록 최대 max_items 개까지만 허용합니다.
+    """
+    try:
+        values = [int(v) for v in value.split(',') if v.strip()]
+    except Exception:
+        raise HTTPException(status_code=400, detail=f"Query parameter '{name}' must be comma-separated integers. Received: {value}")
+    if len(values) > max_items:
+        raise HTTPException(status_code=400, detail=f"Query parameter '{name}' accepts at most {max_items} values. Received: {len(values)}")
+    return values
+
+GEOMETRY_PATTERN = "^(points|polyline)$"
+
+@router.get("/courses", response_model=CourseListResponse, response_model_exclude_none=True)
+def get_courses(
+    user_id: Optional[int] = Query(None),
+    ids: Optional[str] = Query(None, description="쉼표로 구분한 코스 id 목록 (예: 1,2,3)"),
+    zoom: Optional[int] = Query(None, ge=0, le=MAX_ZOOM, description="지도 줌 레벨에 맞게 경로를 단순화"),
+    tolerance: Optional[float] = Query(None, gt=0, description="경로 단순화 허용 오차 (도 단위)"),
+    geometry: str = Query(GEOMETRY_POINTS, pattern=GEOMETRY_PATTERN, description="경로 형식 (points | polyline)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="전체 코스 조회 시 페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    supabase: Client = Depends(get_supabase)
+):
   """
   user_id가 없으면 전체 코스 반환.
   user_id가 주어지면 해당 사용자가 completed_courses에 기록한 코스만 반환.
+  ids가 주어지면 해당 코스들만 요청한 순서대로 반환.
+  zoom 또는 tolerance가 주어지면 경로를 Douglas-Peucker 로 단순화해서 반환. (zoom 우선)
+  geometry=polyline이면 paths 대신 Google Encoded Polyline 문자열(polyline)로 반환.
+  전체 코스 조회 시 limit이 주어지면 (created_at, id) 순으로 limit개씩 반환하고 next_cursor를 함께 반환.
   """
   try:
+    if ids is not None:
+      courses = get_courses_by_ids_service(_parse_int_list('ids', ids), supabase, zoom, tolerance, geometry)
+      return CourseListResponse(courses=courses)
+
     if user_id is None:
-      courses = get_all_courses_service(supabase)
+      if limit is not None:
+        courses, next_cursor = get_courses_page_service(supabase, limit, cursor, zoom, tolerance, geometry)
+        return CourseListResponse(courses=courses, next_cursor=next_cursor)
+      courses = get_all_courses_service(supabase, zoom, tolerance, geometry)
       return CourseListResponse(courses=courses)
 
     # user_id가 주어진 경우: 완료한 코스만 반환
-    courses = get_completed_courses_service(user_id, supabase)
+    courses = get_completed_courses_service(user_id, supabase, zoom, tolerance, geometry)
     return CourseListResponse(courses=courses)
+  except ValueError as e:
+    raise HTTPException(400, detail=str(e))
   except HTTPException:
     raise
   except Exception as e:
     raise HTTPException(500, detail="코스 조회 중 오류가 발생했습니다.")
 
-@router.get("/courses/{course_id}", response_model=Course)
-def get_course_detail(course_id: str, supabase: Client = Depends(get_supabase)):
+@router.get("/courses/nearby", response_model=CourseListResponse, response_model_exclude_none=True)
+def get_nearby_courses(
+    lat: float = Query(..., ge=-90, le=90),
+    lng: float = Query(..., ge=-180, le=180),
+    radius: float = Query(5.0, gt=0, le=50, description="검색 반경 (km)"),
+    zoom: Optional[int] = Query(None, ge=0, le=MAX_ZOOM, description="지도 줌 레벨에 맞게 경로를 단순화"),
+    geometry: str = Query(GEOMETRY_POINTS, pattern=GEOMETRY_PATTERN, description="경로 형식 (points | polyline)"),
+    supabase: Client = Depends(get_supabase)
+):
+  """
+  현재 위치에서 radius(km) 이내에서 시작하는 코스를 가까운 순으로 반환합니다.
+  """
+  try:
+    courses = get_nearby_courses_service(lat, lng, radius, supabase, zoom, geometry)
+    return CourseListResponse(courses=courses)
+  except Exception as e:
+    raise HTTPException(500, detail="주변 코스 조회 중 오류가 발생했습니다.")
+
+@router.get("/courses/{course_id}", response_model=Course, response_model_exclude_none=True)
+def get_course_detail(
+    course_id: str,
+    geometry: str = Query(GEOMETRY_POINTS, pattern=GEOMETRY_PATTERN, description="경로 형식 (points | polyline)"),
+    supabase: Client = Depends(get_supabase)
+):
   """
   특정 코스의 상세 정보를 조회합니다.
   """
   try:
     cid = _parse_int_from_path('course_id', course_id)
-    course = get_course_by_id_service(cid, supabase)
+    course = get_course_by_id_service(cid, supabase, geometry)
     
     if not course:
       raise HTTPException(404, detail="코스를 찾을 수 없습니다.")
@@ -172,11 +234,29 @@ def delete_review(course_id: str, user_id: str, supabase: Client = Depends(get_s
     except Exception as e:
       raise HTTPException(500, detail="리뷰 삭제 중 오류가 발생했습니다.")
 
+@router.get("/reviews/{course_id}/summary", response_model=ReviewSummaryResponse)
+def get_review_summary(course_id: str, supabase: Client = Depends(get_supabase)):
+    """
+    코스의 리뷰 개수, 평균 평점, 평점 분포, 키워드 빈도를 반환합니다.
+    """
+    try:
+      cid = _parse_int_from_path('course_id', course_id)
+      return get_review_summary_service(cid, supabase)
+    except HTTPException:
+      raise
+    except Exception as e:
+      raise HTTPException(500, detail="리뷰 요약 조회 중 오류가 발생했습니다.")
+
 @router.get("/reviews/{course_id}", response_model=ReviewListReponse)
-def get_reviews(course_id: str, supabase: Client = Depends(get_supabase)):
+def get_reviews(
+    course_id: str,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    supabase: Client = Depends(get_supabase)
+):
     try:
       cid = _parse_int_from_path('course_id', course_id)
-      reviews = get_reviews_by_course(cid, supabase)
+      reviews, next_cursor = get_reviews_page(cid, supabase, limit, cursor, ReviewItem)
       review_items = [
         ReviewItem(
           title=review["title"],
@@ -186,7 +266,9 @@ def get_reviews(course_id: str, supabase: Client = Depends(get_supabase)):
         )
         for review in reviews
       ]
-      return ReviewListReponse(reviews=review_items)
+      return ReviewListReponse(reviews=review_items, next_cursor=next_cursor)
+    except ValueError as e:
+      raise HTTPException(400, detail=str(e))
     except HTTPException:
       raise
     except Exception as e:
@@ -4,6 +4,7 @@ from supabase import Client
 from app.schemas.schemas import *
 from app.services.mbti_service import save_mbti_service, get_mbti_service
 from app.core.supabase_client import get_supabase
+from app.core.executor import run_db
 
 router = APIRouter()
 
@@ -20,7 +21,7 @@ async def save_mbti(
     - **mbti**: MBTI 유형 (예: INFP, ENFJ 등)
     """
     try:
-        result = save_mbti_service(user_id, request.mbti, supabase)
+        result = await run_db(save_mbti_service, user_id, request.mbti, supabase)
         return Message(
             message=f"이얏 당신의 MBTI는 {request.mbti}이군요!"
         )
@@ -38,7 +39,7 @@ async def get_mbti(
     - **user_id**: 사용자 ID
     """
     try:
-        mbti = get_mbti_service(user_id, supabase)
+        mbti = await run_db(get_mbti_service, user_id, supabase)
         
         if not mbti:
             raise HTTPException(404, detail="사용자를 찾을 수 없거나 MBTI가 설정되지 않았습니다.")
@@ -0,0 +1,37 @@
+# app/api/metrics.py
+from fastapi import APIRouter
+import anyio.to_thread
+from app.core.executor import db_executor, hash_executor
+from app.core.supabase_client import supabase_factory
+from app.services.course_service import course_catalog_stats
+from app.services.quiz_service import quiz_pool_stats
+from app.services.mbti_service import user_profile_stats
+from app.services.seamotion_service import sea_emotion_cache_stats, sea_emotion_retention
+from app.services.seamotion_warmer import sea_emotion_warmer
+
+router = APIRouter()
+
+@router.get("/metrics")
+async def get_metrics():
+    """
+    커넥션 풀, DB 스레드 풀, 캐시 상태 지표
+    - supabase_pool.in_flight 가 max_connections 에 가까우면 커넥션 풀을 늘려야 합니다.
+    - db_executor.queued 가 계속 쌓이면 DB_POOL_SIZE 를 늘려야 합니다.
+    - password_hash.queued 가 계속 쌓이면 PASSWORD_HASH_WORKERS 를 늘리거나 BCRYPT_ROUNDS 를 낮춰야 합니다.
+    """
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    return {
+        "supabase_pool": supabase_factory.stats(),
+        "db_executor": db_executor.stats(),
+        "password_hash": hash_executor.stats(),
+        "threadpool": {
+            "total_tokens": limiter.total_tokens,
+            "borrowed_tokens": limiter.borrowed_tokens,
+        },
+        "course_catalog": course_catalog_stats(),
+        "quiz_pool": quiz_pool_stats(),
+        "user_profile": user_profile_stats(),
+        "sea_emotion": sea_emotion_cache_stats(),
+        "sea_emotion_prewarm": sea_emotion_warmer.stats(),
+        "sea_emotion_retention": sea_emotion_retention.stats(),
+    }
@@ -5,10 +5,13 @@ from app.schemas.schemas import *
 from app.services.question_service import (
     create_question_service,
     get_question_service,
-    get_question_list_service,
+    get_question_page_service,
     answer_question_service
 )
 from app.core.supabase_client import get_supabase
+from app.core.executor import run_db
+from app.core.security import get_token_user_id, resolve_path_user
+from app.core.pagination import MAX_PAGE_SIZE
 from typing import Optional
 
 router = APIRouter()
@@ -42,7 +45,7 @@ async def answer_question(
     """
     try:
         # 실제 서비스 호출 (answerer id 전달)
-        result = answer_question_service(question_id, answer.answer, supabase, answerer_id=user_id)
+        result = await run_db(answer_question_service, question_id, answer.answer, supabase, answerer_id=user_id)
         return Message(message="질문 답변 성공!")
     except ValueError as e:
         raise HTTPException(404, detail=str(e))
@@ -58,13 +61,16 @@ async def create_question(
     course_id: int, 
     user_id: int, 
     question: QuestionItem,
-    supabase: Client = Depends(get_supabase)
+    supabase: Client = Depends(get_supabase),
+    token_user_id: Optional[int] = Depends(get_token_user_id)
 ):
     """
     코스 탐방 완료 후 다음 사람에게 질문 생성
+    Bearer 토큰의 사용자가 user_id와 같으면 사용자 조회를 생략합니다.
     """
+    user_verified = resolve_path_user(user_id, token_user_id)
     try:
-        result = create_question_service(user_id, course_id, question, supabase)
+        result = await run_db(create_question_service, user_id, course_id, question, supabase, user_verified=user_verified)
         return Message(message="당신의 질문이 생성되었습니다!")
     except ValueError as e:
         raise HTTPException(404, detail=str(e))
@@ -82,7 +88,7 @@ async def get_question(
     특정 코스의 가장 최근 질문 조회
     """
     try:
-        question = get_question_service(course_id, supabase)
+        question = await run_db(get_question_service, course_id, supabase, QuestionItem)
         
         if not question:
             raise HTTPException(404, detail="질문을 찾을 수 없습니다.")
@@ -104,13 +110,16 @@ async def get_question(
 @router.get("/questions/{course_id}/list", response_model=QuestionListResponse)
 async def get_question_list(
     course_id: int,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
     supabase: Client = Depends(get_supabase)
 ):
     """
     특정 코스의 모든 질문 목록 조회
+    limit이 주어지면 최신순으로 limit개씩 반환하고 next_cursor를 함께 반환
     """
     try:
-        questions = get_question_list_service(course_id, supabase)
+        questions, next_cursor = await run_db(get_question_page_service, course_id, supabase, limit, cursor, QuestionItem)
         
         question_items = [
             QuestionItem(
@@ -123,6 +132,8 @@ async def get_question_list(
             for q in questions
         ]
         
-        return QuestionListResponse(questions=question_items)
+        return QuestionListResponse(questions=question_items, next_cursor=next_cursor)
+    except ValueError as e:
+        raise HTTPException(400, detail=str(e))
     except Exception:
         raise HTTPException(500, detail="질문 목록 조회 중 오류가 발생했습니다.")
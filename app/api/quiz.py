@@ -1,5 +1,5 @@
 # app/routes/quiz.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from supabase import Client
 from app.schemas.schemas import *
 from app.core.supabase_client import get_supabase
@@ -11,14 +11,38 @@ router = APIRouter()
 @router.get("/quizes", response_model=QuizResponse)
 def get_random_quizes(supabase: Client = Depends(get_supabase)):
   try:
-    quiz = get_random_quiz_service(supabase)
+    # 퀴즈 풀에 미리 직렬화해 둔 응답을 그대로 반환
+    payload = get_random_quiz_payload_service(supabase)
 
-    if not quiz:
+    if not payload:
       raise HTTPException(404, detail="퀴즈를 찾을 수 없습니다.")
     
-    return QuizResponse(id = quiz['id'], title = quiz['title'], content = quiz['content'], correct = quiz['correct'])
+    return Response(content=payload, media_type="application/json")
   except HTTPException:
     raise
   except Exception as e:
     traceback.print_exc()
-    raise HTTPException(500, detail=f"퀴즈 조회 중 오류가 발생했습니다: {str(e)}")
\ No newline at end of file
+    raise HTTPException(500, detail=f"퀴즈 조회 중 오류가 발생했습니다: {str(e)}")
+
+@router.get("/quizes/batch", response_model=QuizBatchResponse)
+def get_quiz_batch(
+    session_id: str = Query(..., description="사용자 id 또는 클라이언트 세션 id"),
+    n: int = Query(5, ge=1, le=50, description="한 번에 받을 퀴즈 수"),
+    supabase: Client = Depends(get_supabase)
+):
+  """
+  서로 다른 퀴즈 n개를 한 번에 반환합니다.
+  같은 session_id로 다시 요청하면 이미 받은 퀴즈는 모두 본 뒤에야 다시 나옵니다.
+  """
+  try:
+    payload = get_quiz_batch_payload_service(session_id, n, supabase)
+
+    if not payload:
+      raise HTTPException(404, detail="퀴즈를 찾을 수 없습니다.")
+
+    return Response(content=payload, media_type="application/json")
+  except HTTPException:
+    raise
+  except Exception as e:
+    traceback.print_exc()
+    raise HTTPException(500, detail=f"퀴즈 조회 중 오류가 발생했습니다: {str(e)}")
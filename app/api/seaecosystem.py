@@ -1,18 +1,17 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Depends
 from app.schemas.schemas import *
 from typing import Optional
-import os
-from supabase import create_client, Client
+from supabase import Client
+from app.core.executor import run_db
+from app.core.supabase_client import get_supabase_anon
 
 router = APIRouter()
 
-# Supabase 클라이언트 설정 (환경변수 확인 필요)
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY) if SUPABASE_URL and SUPABASE_KEY else None
-
 @router.get("/seaecosystem", response_model=SeaEcosystemResponse)
-async def get_sea_ecosystem(location: Optional[str] = Query(None, description="지역명")):
+async def get_sea_ecosystem(
+    location: Optional[str] = Query(None, description="지역명"),
+    supabase: Optional[Client] = Depends(get_supabase_anon)
+):
     """
     해양 생태계 불러오기 API
     - 특정 지역의 대표 생물, 특산물 정보 반환
@@ -22,7 +21,7 @@ async def get_sea_ecosystem(location: Optional[str] = Query(None, description="
             raise HTTPException(status_code=400, detail="지역명을 입력해주세요")
         
         # 임시 데이터 (실제로는 DB에서 조회)
-        ecosystem_data = get_ecosystem_from_db(location)
+        ecosystem_data = await run_db(get_ecosystem_from_db, location, supabase)
         
         if not ecosystem_data:
             raise HTTPException(status_code=404, detail="해당 지역 정보를 찾을 수 없습니다")
@@ -38,7 +37,7 @@ async def get_sea_ecosystem(location: Optional[str] = Query(None, description="
         raise HTTPException(status_code=500, detail=f"생태계 정보 조회 실패: {str(e)}")
 
 
-def get_ecosystem_from_db(location: str) -> Optional[dict]:
+def get_ecosystem_from_db(location: str, supabase: Optional[Client]) -> Optional[dict]:
     """
     데이터베이스에서 해양 생태계 정보 조회
     """
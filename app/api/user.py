@@ -2,8 +2,16 @@
 from fastapi import APIRouter, Depends, HTTPException
 from supabase import Client
 from app.schemas.schemas import *
-from app.services.user_service import signup_service
+from app.services.user_service import (
+    signup_service,
+    hash_password,
+    verify_password,
+    get_user_credentials,
+    update_password_hash
+)
 from app.core.supabase_client import get_supabase
+from app.core.executor import run_db, run_hash
+from app.core.security import create_access_token
 
 router = APIRouter()
 
@@ -19,9 +27,40 @@ async def signup(
     - **password**: 비밀번호
     """
     try:
-        result = signup_service(request.name, request.password, supabase)
+        hashed_password = await run_hash(hash_password, request.password)
+        result = await run_db(signup_service, request.name, hashed_password, supabase)
         return Message(message="회원가입 성공!")
     except ValueError as e:
         raise HTTPException(400, detail=str(e))
     except Exception as e:
-        raise HTTPException(500, detail="회원가입 중 오류가 발생했습니다.")
\ No newline at end of file
+        raise HTTPException(500, detail="회원가입 중 오류가 발생했습니다.")
+
+@router.post("/login", response_model=Token)
+async def login(
+    request: LoginRequest,
+    supabase: Client = Depends(get_supabase)
+):
+    """
+    로그인 후 액세스 토큰을 발급합니다.
+    이후 요청은 Authorization: Bearer <access_token> 헤더로 사용자를 식별합니다.
+    
+    - **name**: 사용자 이름
+    - **password**: 비밀번호
+    """
+    try:
+        user = await run_db(get_user_credentials, request.name, supabase)
+        verified, new_hash = await run_hash(verify_password, request.password, user.get('password') if user else None)
+    except Exception as e:
+        print(f"사용자 인증 실패: {e}")
+        raise HTTPException(500, detail="로그인 중 오류가 발생했습니다.")
+
+    if not verified:
+        raise HTTPException(401, detail="이름 또는 비밀번호가 올바르지 않습니다.", headers={"WWW-Authenticate": "Bearer"})
+    if new_hash:
+        await run_db(update_password_hash, user['id'], new_hash, supabase)
+
+    try:
+        return Token(access_token=create_access_token(user['id']), token_type="bearer")
+    except Exception as e:
+        print(f"토큰 발급 실패: {e}")
+        raise HTTPException(500, detail="로그인 중 오류가 발생했습니다.")
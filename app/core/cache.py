@@ -0,0 +1,246 @@
+# app/core/cache.py
+"""
+프로세스 내 캐시 유틸리티
+"""
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class Snapshot:
+    """캐시에 보관되는 한 시점의 전체 데이터"""
+    __slots__ = ('version', 'value', 'loaded_at')
+
+    def __init__(self, version: int, value: Any, loaded_at: float):
+        self.version = version
+        self.value = value
+        self.loaded_at = loaded_at
+
+
+class SnapshotCache:
+    """
+    전체 데이터를 한 번에 불러와 보관하는 버전 캐시
+
+    - 스냅샷은 통째로 교체되므로 읽는 쪽은 항상 일관된 데이터를 봅니다.
+    - TTL이 지나면 기존 스냅샷을 그대로 반환하면서 백그라운드에서 갱신합니다.
+    - invalidate() 이후 첫 조회는 새 데이터를 불러올 때까지 기다립니다.
+    """
+
+    def __init__(self, name: str, loader: Callable[..., Any], ttl_seconds: float):
+        self.name = name
+        self.loader = loader
+        self.ttl_seconds = ttl_seconds
+
+        self._snapshot: Optional[Snapshot] = None
+        self._version = 0
+        self._generation = 0  # invalidate() 마다 증가, 그 전에 시작된 로드 결과는 버립니다.
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._refreshing = False
+
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.errors = 0
+
+    def get(self, *args) -> Snapshot:
+        """
+        현재 스냅샷을 반환합니다. args는 loader에 그대로 전달됩니다.
+        """
+        snap = self._snapshot
+        if snap is not None:
+            self.hits += 1
+            if time.monotonic() - snap.loaded_at >= self.ttl_seconds:
+                self._refresh_in_background(args)
+            return snap
+
+        with self._load_lock:
+            snap = self._snapshot
+            if snap is not None:
+                self.hits += 1
+                return snap
+            self.misses += 1
+            return self._load(args)
+
+    def invalidate(self) -> None:
+        """
+        스냅샷을 버립니다. 다음 조회 시 새로 불러옵니다.
+        """
+        with self._lock:
+            self._generation += 1
+            self._snapshot = None
+
+    def refresh_if_older_than(self, min_age_seconds: float, *args) -> bool:
+        """
+        스냅샷이 min_age_seconds 보다 오래되었으면 기존 스냅샷을 계속 반환하면서 백그라운드에서 갱신합니다.
+        (캐시에 없는 데이터가 발견되었을 때, 조회마다 스냅샷을 버리지 않도록 갱신 빈도를 제한합니다.)
+        갱신을 시작했으면 True.
+        """
+        snap = self._snapshot
+        if snap is None or time.monotonic() - snap.loaded_at < min_age_seconds:
+            return False
+        self._refresh_in_background(args)
+        return True
+
+    def stats(self) -> dict:
+        snap = self._snapshot
+        return {
+            'name': self.name,
+            'version': snap.version if snap else None,
+            'age_seconds': round(time.monotonic() - snap.loaded_at, 3) if snap else None,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'refreshes': self.refreshes,
+            'errors': self.errors,
+            'refreshing': self._refreshing,
+        }
+
+    def _load(self, args) -> Snapshot:
+        generation = self._generation
+        value = self.loader(*args)
+        with self._lock:
+            self._version += 1
+            snap = Snapshot(self._version, value, time.monotonic())
+            if generation == self._generation:
+                self._snapshot = snap
+        return snap
+
+    def _refresh_in_background(self, args) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def refresh():
+            try:
+                self._load(args)
+                self.refreshes += 1
+            except Exception as e:
+                self.errors += 1
+                print(f"캐시 갱신 실패 ({self.name}): {e}")
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=refresh, name=f"{self.name}-refresh", daemon=True).start()
+
+
+MISSING = object()
+
+
+class LRUCache:
+    """
+    크기 제한과 TTL이 있는 키-값 캐시
+    max_size 를 넘으면 가장 오래 쓰지 않은 항목부터 버립니다.
+    ttl_seconds 는 기본 만료 시간이며 set() 에서 항목별로 바꿀 수 있습니다.
+    """
+
+    def __init__(self, name: str, max_size: int, ttl_seconds: Optional[float] = None):
+        self.name = name
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._items: "OrderedDict[Any, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=MISSING):
+        """
+        값을 반환합니다. 없거나 만료되었으면 default (기본값 MISSING).
+        """
+        now = time.monotonic()
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                value, expires_at = item
+                if expires_at is None or expires_at > now:
+                    self._items.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._items[key]
+            self.misses += 1
+            return default
+
+    def peek(self, key, default=MISSING):
+        """
+        적중/미적중 통계와 사용 순서를 바꾸지 않고 값을 확인합니다.
+        """
+        with self._lock:
+            item = self._items.get(key)
+        if item is None or (item[1] is not None and item[1] <= time.monotonic()):
+            return default
+        return item[0]
+
+    def set(self, key, value, ttl_seconds: Optional[float] = None) -> None:
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._items[key] = (value, expires_at)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key) -> None:
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'name': self.name,
+            'size': len(self._items),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else None,
+            'evictions': self.evictions,
+        }
+
+
+class AsyncSingleFlight:
+    """
+    같은 키로 동시에 들어온 코루틴 호출을 하나로 합칩니다.
+    먼저 온 호출(leader)만 fn()을 Task로 실행하고, 실행 중에 들어온 호출은 같은 Task를 await 해 결과(또는 예외)를 함께 받습니다.
+    기다리는 쪽은 이벤트 루프에서 대기하므로 스레드 풀(run_db)의 스레드를 잡지 않습니다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._tasks: Dict[Any, asyncio.Task] = {}
+
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key, fn: Callable[[], Awaitable[Any]]) -> Any:
+        self.calls += 1
+        task = self._tasks.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.executions += 1
+            task = self._tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        # 요청 하나가 취소되어도 다른 대기자가 받을 Task는 계속 실행되도록 shield 합니다.
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        return {
+            'name': self.name,
+            'in_flight': len(self._tasks),
+            'calls': self.calls,
+            'executions': self.executions,
+            'coalesced': self.coalesced,
+        }
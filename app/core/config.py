@@ -7,7 +7,7 @@ load_dotenv()
 
 class Settings:
     SECRET_KEY: str = os.getenv("SECRET_KEY")
-    ALGORITHM: str = os.getenv("ALGORITHM")
+    ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
 
     # Supabase 설정
@@ -15,4 +15,54 @@ class Settings:
     SUPABASE_KEY: str = os.getenv("SUPABASE_KEY")
     SUPABASE_SERVICE_KEY: str = os.getenv("SUPABASE_SERVICE_KEY")
 
+    # 코스 카탈로그 캐시 설정
+    COURSE_CATALOG_TTL_SECONDS: int = int(os.getenv("COURSE_CATALOG_TTL_SECONDS", 300))
+    # 카탈로그에 없는 코스가 조회되었을 때 다시 불러오기까지의 최소 간격
+    COURSE_CATALOG_MIN_REFRESH_SECONDS: int = int(os.getenv("COURSE_CATALOG_MIN_REFRESH_SECONDS", 30))
+
+    # 퀴즈 풀 재적재 주기
+    QUIZ_POOL_TTL_SECONDS: int = int(os.getenv("QUIZ_POOL_TTL_SECONDS", 300))
+    # 퀴즈 묶음 조회 시 본 퀴즈를 기억할 최대 세션 수
+    QUIZ_SESSION_MAX: int = int(os.getenv("QUIZ_SESSION_MAX", 10000))
+
+    # 사용자 프로필(MBTI) 캐시 크기와 재조회 주기
+    USER_PROFILE_CACHE_SIZE: int = int(os.getenv("USER_PROFILE_CACHE_SIZE", 10000))
+    USER_PROFILE_TTL_SECONDS: int = int(os.getenv("USER_PROFILE_TTL_SECONDS", 300))
+
+    # 바다 성격 캐시: 기본 버킷 길이(초)와 지역별 재정의 ("해운대=300,광안리=900")
+    SEA_EMOTION_TTL_SECONDS: int = int(os.getenv("SEA_EMOTION_TTL_SECONDS", 600))
+    SEA_EMOTION_TTL_OVERRIDES: str = os.getenv("SEA_EMOTION_TTL_OVERRIDES", "")
+    SEA_EMOTION_CACHE_SIZE: int = int(os.getenv("SEA_EMOTION_CACHE_SIZE", 1000))
+    # 해양 데이터 API 키 (.env 또는 환경 변수로만 설정)
+    SEA_API_KEY: str = os.getenv("SEA_API_KEY", "")
+    # 바다 성격 예열: 버킷이 끝나기 몇 초 전부터 다음 버킷을 채울지, 지터, 동시 실행 수, 점검 주기
+    SEA_EMOTION_PREWARM: bool = os.getenv("SEA_EMOTION_PREWARM", "true").lower() == "true"
+    SEA_EMOTION_PREWARM_LEAD_SECONDS: int = int(os.getenv("SEA_EMOTION_PREWARM_LEAD_SECONDS", 60))
+    SEA_EMOTION_PREWARM_JITTER_SECONDS: int = int(os.getenv("SEA_EMOTION_PREWARM_JITTER_SECONDS", 20))
+    SEA_EMOTION_PREWARM_CONCURRENCY: int = int(os.getenv("SEA_EMOTION_PREWARM_CONCURRENCY", 4))
+    SEA_EMOTION_PREWARM_TICK_SECONDS: int = int(os.getenv("SEA_EMOTION_PREWARM_TICK_SECONDS", 15))
+    # sea_emotions 보존 기간(일)과 정리 주기, 배치 크기, 한 번 실행에 지울 최대 배치 수
+    SEA_EMOTION_RETENTION_DAYS: int = int(os.getenv("SEA_EMOTION_RETENTION_DAYS", 7))
+    SEA_EMOTION_RETENTION_INTERVAL_SECONDS: int = int(os.getenv("SEA_EMOTION_RETENTION_INTERVAL_SECONDS", 3600))
+    SEA_EMOTION_RETENTION_BATCH_SIZE: int = int(os.getenv("SEA_EMOTION_RETENTION_BATCH_SIZE", 500))
+    SEA_EMOTION_RETENTION_MAX_BATCHES: int = int(os.getenv("SEA_EMOTION_RETENTION_MAX_BATCHES", 20))
+    # 예열 대상 지역 목록을 다시 읽는 주기
+    SEA_EMOTION_LOCATIONS_TTL_SECONDS: int = int(os.getenv("SEA_EMOTION_LOCATIONS_TTL_SECONDS", 600))
+
+    # Supabase 호출 전용 스레드 풀 크기 (동시에 진행할 수 있는 DB 호출 수)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 64))
+
+    # 비밀번호 해시(bcrypt) 전용 스레드 풀 크기와 bcrypt 비용 계수
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", 4))
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", 12))
+
+    # Supabase HTTP 커넥션 풀 설정 (DB_POOL_SIZE 이상으로 두어야 스레드가 커넥션을 기다리지 않습니다.)
+    SUPABASE_MAX_CONNECTIONS: int = int(os.getenv("SUPABASE_MAX_CONNECTIONS", 100))
+    SUPABASE_MAX_KEEPALIVE: int = int(os.getenv("SUPABASE_MAX_KEEPALIVE", 50))
+    SUPABASE_KEEPALIVE_EXPIRY: float = float(os.getenv("SUPABASE_KEEPALIVE_EXPIRY", 30))
+    SUPABASE_TIMEOUT: float = float(os.getenv("SUPABASE_TIMEOUT", 10))
+    SUPABASE_CONNECT_TIMEOUT: float = float(os.getenv("SUPABASE_CONNECT_TIMEOUT", 5))
+    SUPABASE_POOL_TIMEOUT: float = float(os.getenv("SUPABASE_POOL_TIMEOUT", 5))
+    SUPABASE_HTTP2: bool = os.getenv("SUPABASE_HTTP2", "false").lower() == "true"
+
 settings = Settings()
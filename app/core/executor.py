@@ -0,0 +1,99 @@
+# app/core/executor.py
+"""
+동기 함수를 이벤트 루프 밖의 전용 스레드 풀에서 실행하는 유틸리티
+Supabase(PostgREST) 클라이언트는 동기 방식이므로 async 핸들러에서는 반드시 이 풀을 거쳐 호출합니다.
+비밀번호 해시처럼 CPU를 오래 쓰는 작업은 DB 풀과 섞이지 않도록 별도 풀에서 실행합니다.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from app.core.config import settings
+
+
+class BoundedExecutor:
+    """
+    최대 max_workers 개의 스레드로 동기 함수를 실행하는 풀
+    실행 중/대기 중 작업 수를 지표로 제공합니다.
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.active = 0
+        self.max_queued = 0
+
+    def _wrap(self, fn: Callable, args, kwargs):
+        def call():
+            with self._lock:
+                self.active += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.active -= 1
+                    self.completed += 1
+        return call
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """
+        fn(*args, **kwargs) 를 풀에서 실행하고 결과를 기다립니다.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self.submitted += 1
+            queued = self.submitted - self.completed - self.active
+            self.max_queued = max(self.max_queued, queued)
+        return await loop.run_in_executor(self._pool, self._wrap(fn, args, kwargs))
+
+    def submit(self, fn: Callable, *args, **kwargs):
+        """
+        이벤트 루프 밖(백그라운드 스레드 등)에서 사용할 때의 제출 함수. Future를 반환합니다.
+        """
+        with self._lock:
+            self.submitted += 1
+        return self._pool.submit(self._wrap(fn, args, kwargs))
+
+    def stats(self) -> dict:
+        with self._lock:
+            in_flight = self.submitted - self.completed
+            return {
+                'name': self.name,
+                'max_workers': self.max_workers,
+                'active': self.active,
+                'queued': in_flight - self.active,
+                'max_queued': self.max_queued,
+                'submitted': self.submitted,
+                'completed': self.completed,
+            }
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Supabase 호출 전용 풀
+db_executor = BoundedExecutor('supabase', settings.DB_POOL_SIZE)
+
+
+async def run_db(fn: Callable, *args, **kwargs) -> Any:
+    """
+    DB(Supabase)를 호출하는 동기 서비스 함수를 이벤트 루프를 막지 않고 실행합니다.
+    """
+    return await db_executor.run(fn, *args, **kwargs)
+
+
+# 비밀번호 해시/검증 전용 풀 (bcrypt는 실행 중 GIL을 놓으므로 스레드로 충분합니다.)
+hash_executor = BoundedExecutor('password-hash', settings.PASSWORD_HASH_WORKERS)
+
+
+async def run_hash(fn: Callable, *args, **kwargs) -> Any:
+    """
+    비밀번호 해시/검증 함수를 전용 풀에서 실행합니다.
+    가입이 몰려도 DB 호출이나 다른 요청이 밀리지 않도록 동시 실행 수를 제한합니다.
+    """
+    return await hash_executor.run(fn, *args, **kwargs)
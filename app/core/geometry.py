@@ -0,0 +1,170 @@
+# app/core/geometry.py
+"""
+코스 경로 좌표 계산 유틸리티
+좌표는 [lat0, lng0, lat1, lng1, ...] 순서의 array('d') 로 다룹니다.
+"""
+import math
+from array import array
+
+MAX_ZOOM = 22
+
+# 코스 경로 응답 형식
+GEOMETRY_POINTS = "points"
+GEOMETRY_POLYLINE = "polyline"
+
+
+def zoom_to_tolerance(zoom: int) -> float:
+    """
+    웹 지도 줌 레벨에서 한 픽셀이 차지하는 경도 폭(도 단위)을 반환합니다.
+    이보다 작은 오차는 화면에서 구분되지 않습니다.
+    """
+    return 360.0 / (256 * (2 ** zoom))
+
+
+def _segment_distance_sq(px: float, py: float, ax: float, ay: float, bx: float, by: float) -> float:
+    dx = bx - ax
+    dy = by - ay
+    if dx == 0 and dy == 0:
+        return (px - ax) ** 2 + (py - ay) ** 2
+    t = ((px - ax) * dx + (py - ay) * dy) / (dx * dx + dy * dy)
+    t = max(0.0, min(1.0, t))
+    cx = ax + t * dx
+    cy = ay + t * dy
+    return (px - cx) ** 2 + (py - cy) ** 2
+
+
+def simplify(coords: array, tolerance: float) -> array:
+    """
+    Douglas-Peucker 알고리즘으로 경로를 단순화합니다.
+    시작점과 끝점은 항상 유지되며, tolerance(도 단위)보다 가까운 점들은 제거됩니다.
+    """
+    n = len(coords) // 2
+    if n <= 2 or tolerance <= 0:
+        return array('d', coords)
+
+    tol_sq = tolerance * tolerance
+    keep = bytearray(n)
+    keep[0] = keep[n - 1] = 1
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        ax, ay = coords[2 * first], coords[2 * first + 1]
+        bx, by = coords[2 * last], coords[2 * last + 1]
+        max_dist = -1.0
+        index = first
+        for i in range(first + 1, last):
+            d = _segment_distance_sq(coords[2 * i], coords[2 * i + 1], ax, ay, bx, by)
+            if d > max_dist:
+                max_dist = d
+                index = i
+        if max_dist > tol_sq:
+            keep[index] = 1
+            stack.append((first, index))
+            stack.append((index, last))
+
+    result = array('d')
+    for i in range(n):
+        if keep[i]:
+            result.append(coords[2 * i])
+            result.append(coords[2 * i + 1])
+    return result
+
+
+def _encode_value(value: int, out: list) -> None:
+    value = ~(value << 1) if value < 0 else value << 1
+    while value >= 0x20:
+        out.append(chr((0x20 | (value & 0x1f)) + 63))
+        value >>= 5
+    out.append(chr(value + 63))
+
+
+def encode_polyline(coords: array, precision: int = 5) -> str:
+    """
+    좌표를 Google Encoded Polyline 문자열로 변환합니다.
+    """
+    factor = 10 ** precision
+    out = []
+    prev_lat = prev_lng = 0
+    for i in range(0, len(coords), 2):
+        lat = int(math.floor(coords[i] * factor + 0.5))
+        lng = int(math.floor(coords[i + 1] * factor + 0.5))
+        _encode_value(lat - prev_lat, out)
+        _encode_value(lng - prev_lng, out)
+        prev_lat, prev_lng = lat, lng
+    return ''.join(out)
+
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.32
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 좌표 사이의 대원 거리(km)"""
+    p1 = math.radians(lat1)
+    p2 = math.radians(lat2)
+    dp = p2 - p1
+    dl = math.radians(lng2 - lng1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class GridIndex:
+    """
+    위경도 격자 기반 점 색인
+    각 항목은 하나의 점(lat, lng)을 가지며, cell_deg 크기의 격자 칸에 나눠 담습니다.
+    반경 검색은 원을 덮는 칸들만 확인하므로 전체 항목 수와 무관하게 빠릅니다.
+    """
+
+    def __init__(self, cell_deg: float = 0.05):
+        self.cell_deg = cell_deg
+        self._cells = {}
+        self._points = {}
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def _cell(self, lat: float, lng: float) -> tuple:
+        return (math.floor(lat / self.cell_deg), math.floor(lng / self.cell_deg))
+
+    def add(self, key, lat: float, lng: float) -> None:
+        if key in self._points:
+            self.remove(key)
+        self._points[key] = (lat, lng)
+        self._cells.setdefault(self._cell(lat, lng), set()).add(key)
+
+    def remove(self, key) -> None:
+        point = self._points.pop(key, None)
+        if point is None:
+            return
+        cell = self._cell(*point)
+        keys = self._cells.get(cell)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._cells[cell]
+
+    def get(self, key):
+        return self._points.get(key)
+
+    def keys(self) -> list:
+        return list(self._points)
+
+    def query(self, lat: float, lng: float, radius_km: float) -> list:
+        """
+        (lat, lng) 에서 radius_km 이내의 항목을 [(거리km, key), ...] 가까운 순으로 반환합니다.
+        """
+        dlat = radius_km / KM_PER_DEGREE
+        dlng = radius_km / (KM_PER_DEGREE * max(math.cos(math.radians(lat)), 1e-6))
+        lat_min, lng_min = self._cell(lat - dlat, lng - dlng)
+        lat_max, lng_max = self._cell(lat + dlat, lng + dlng)
+
+        found = []
+        for ci in range(lat_min, lat_max + 1):
+            for cj in range(lng_min, lng_max + 1):
+                for key in self._cells.get((ci, cj), ()):
+                    plat, plng = self._points[key]
+                    dist = haversine_km(lat, lng, plat, plng)
+                    if dist <= radius_km:
+                        found.append((dist, key))
+        found.sort(key=lambda item: item[0])
+        return found
@@ -0,0 +1,80 @@
+# app/core/pagination.py
+"""
+(created_at, id) 기준 키셋 페이지네이션 유틸리티
+커서는 마지막 행의 (created_at, id) 를 base64url 로 감싼 불투명 문자열입니다.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+
+MAX_PAGE_SIZE = 100
+
+# 커서를 만들기 위해 select 에 항상 포함해야 하는 컬럼
+KEYSET_COLUMNS = ('id', 'created_at')
+
+
+# created_at 이 없는 행의 정렬/커서용 값 (가장 이른 시각)
+MIN_TIMESTAMP = datetime.min.isoformat()
+
+
+def timestamp_key(value: Optional[str]) -> str:
+    """
+    created_at 을 decode_cursor 와 같은 형태의 ISO 문자열로 맞춥니다.
+    없거나 파싱할 수 없으면 MIN_TIMESTAMP.
+    """
+    try:
+        return datetime.fromisoformat(value).isoformat()
+    except (TypeError, ValueError):
+        return MIN_TIMESTAMP
+
+
+def encode_cursor(created_at: Optional[str], row_id: int) -> str:
+    raw = json.dumps([created_at, row_id], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    커서를 (created_at, id) 로 풀어냅니다. 형식이 잘못되면 ValueError.
+    커서는 클라이언트가 보낸 값이므로 created_at 은 ISO 시각으로 파싱한 뒤 다시 만든 문자열만 반환합니다.
+    (필터 문자열에 그대로 들어가므로 임의의 문자를 허용하지 않습니다.)
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+        if not isinstance(created_at, str) or isinstance(row_id, bool):
+            raise TypeError
+        return datetime.fromisoformat(created_at).isoformat(), int(row_id)
+    except Exception:
+        raise ValueError("잘못된 페이지 커서입니다.")
+
+
+def cursor_from_row(row: dict) -> str:
+    return encode_cursor(row.get('created_at'), row.get('id'))
+
+
+def apply_keyset(query, cursor: Optional[str], limit: Optional[int]):
+    """
+    PostgREST 쿼리에 (created_at desc, id desc) 정렬과 커서 이후 조건을 붙입니다.
+    다음 페이지 유무를 알기 위해 limit + 1 행을 요청합니다.
+    """
+    query = query.order('created_at', desc=True).order('id', desc=True)
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.or_(
+            f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.lt.{row_id})'
+        )
+    if limit is not None:
+        query = query.limit(limit + 1)
+    return query
+
+
+def split_page(rows: list, limit: Optional[int]) -> Tuple[list, Optional[str]]:
+    """
+    limit + 1 로 가져온 행을 (이번 페이지, next_cursor) 로 나눕니다.
+    """
+    if limit is None or len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, cursor_from_row(page[-1])
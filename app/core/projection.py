@@ -0,0 +1,21 @@
+# app/core/projection.py
+"""
+응답 모델에서 필요한 컬럼만 골라 select 문자열을 만드는 유틸리티
+"""
+from typing import Iterable, Type
+from pydantic import BaseModel
+
+
+def _quote(column: str) -> str:
+    # camelCase 컬럼은 큰따옴표로 감싸야 대소문자가 유지됩니다.
+    return f'"{column}"' if column != column.lower() else column
+
+
+def columns_for(model: Type[BaseModel], extra: Iterable[str] = ()) -> str:
+    """
+    model 의 필드명(+ extra 컬럼)으로 PostgREST select 문자열을 만듭니다.
+    예) columns_for(ReviewItem, ('id', 'created_at')) -> 'title, keyword, rating, content, id, created_at'
+    """
+    columns = list(model.model_fields)
+    columns += [c for c in extra if c not in columns]
+    return ', '.join(_quote(c) for c in columns)
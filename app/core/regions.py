@@ -0,0 +1,95 @@
+# app/core/regions.py
+"""
+지역 레지스트리 (API와 백그라운드 작업이 함께 사용하는 지역 데이터)
+"""
+from typing import List
+
+# 테스트용 지역 데이터
+REGIONS_DATA = {
+    "saha": {
+        "id": "saha",
+        "name": "사하구",
+        "code": "saha",
+        "latitude": 35.1047,
+        "longitude": 129.0263,
+        "description": "부산광역시 사하구",
+        "ecosystem": {
+            "representative_species": ["멸치", "고등어", "전복", "해조류"],
+            "specialties": ["멸치젓", "전복", "해조류"],
+            "sea_condition": "잔잔한 파도, 얕은 바다",
+            "representative_resorts": ["을숙도", "낙동강 하구"],
+            "ecosystem_description": "낙동강 하구와 접한 사하구는 다양한 해양 생물이 서식하는 생태계가 발달했습니다."
+        }
+    },
+    "gijang": {
+        "id": "gijang",
+        "name": "기장군",
+        "code": "gijang",
+        "latitude": 35.2444,
+        "longitude": 129.2139,
+        "description": "부산광역시 기장군",
+        "ecosystem": {
+            "representative_species": ["멍게", "해삼", "전복", "다랑어"],
+            "specialties": ["멍게", "해삼", "전복"],
+            "sea_condition": "깊은 바다, 강한 파도",
+            "representative_resorts": ["해운대", "송정해수욕장", "일광해수욕장"],
+            "ecosystem_description": "동해와 접한 기장군은 깊은 바다와 다양한 해양 생물이 서식하는 지역입니다."
+        }
+    },
+    "yeongdo": {
+        "id": "yeongdo",
+        "name": "영도구",
+        "code": "yeongdo",
+        "latitude": 35.0914,
+        "longitude": 129.0678,
+        "description": "부산광역시 영도구",
+        "ecosystem": {
+            "representative_species": ["고등어", "꽁치", "멸치", "해조류"],
+            "specialties": ["고등어", "멸치젓"],
+            "sea_condition": "중간 깊이, 적당한 파도",
+            "representative_resorts": ["태종대", "영도대교"],
+            "ecosystem_description": "부산항과 접한 영도구는 다양한 어류가 서식하는 해양 생태계를 가지고 있습니다."
+        }
+    },
+    "nam": {
+        "id": "nam",
+        "name": "남구",
+        "code": "nam",
+        "latitude": 35.1367,
+        "longitude": 129.0844,
+        "description": "부산광역시 남구",
+        "ecosystem": {
+            "representative_species": ["전복", "해조류", "멸치"],
+            "specialties": ["전복", "해조류"],
+            "sea_condition": "잔잔한 파도",
+            "representative_resorts": ["이기대", "용호동"],
+            "ecosystem_description": "남구는 해조류가 풍부하고 전복 양식이 발달한 지역입니다."
+        }
+    },
+    "seo": {
+        "id": "seo",
+        "name": "서구",
+        "code": "seo",
+        "latitude": 35.0979,
+        "longitude": 129.0244,
+        "description": "부산광역시 서구",
+        "ecosystem": {
+            "representative_species": ["멸치", "고등어", "해조류"],
+            "specialties": ["멸치젓"],
+            "sea_condition": "얕은 바다, 잔잔한 파도",
+            "representative_resorts": ["송도해수욕장"],
+            "ecosystem_description": "서구는 얕은 바다와 해조류가 풍부한 해양 생태계를 가지고 있습니다."
+        }
+    }
+}
+
+
+def region_locations() -> List[str]:
+    """
+    등록된 지역 이름과 대표 해변/명소 이름을 중복 없이 반환합니다.
+    """
+    locations = []
+    for data in REGIONS_DATA.values():
+        locations.append(data["name"])
+        locations.extend(data.get("ecosystem", {}).get("representative_resorts", []))
+    return list(dict.fromkeys(locations))
@@ -0,0 +1,62 @@
+# app/core/scheduler.py
+"""
+주기적으로 실행하는 백그라운드 작업 유틸리티
+"""
+import asyncio
+import random
+from typing import Any, Callable, Optional
+
+from app.core.executor import run_db
+
+
+class PeriodicTask:
+    """
+    동기 함수 fn(*args) 를 interval_seconds 마다 DB 풀에서 실행하는 asyncio 작업
+    FastAPI lifespan 에서 start(*args)/stop() 합니다.
+    여러 워커가 동시에 실행하지 않도록 첫 실행은 0~interval_seconds 사이에서 무작위로 미룹니다.
+    """
+
+    def __init__(self, name: str, interval_seconds: float, fn: Callable[..., Any]):
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.fn = fn
+        self.args: tuple = ()
+        self._task: Optional[asyncio.Task] = None
+
+        self.runs = 0
+        self.errors = 0
+        self.last_result: Any = None
+
+    def start(self, *args) -> None:
+        if self._task is None:
+            self.args = args
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        await asyncio.sleep(random.uniform(0, self.interval_seconds))
+        while True:
+            try:
+                self.last_result = await run_db(self.fn, *self.args)
+                self.runs += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                print(f"주기 작업 실패 ({self.name}): {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def stats(self) -> dict:
+        return {
+            'name': self.name,
+            'running': self._task is not None and not self._task.done(),
+            'interval_seconds': self.interval_seconds,
+            'runs': self.runs,
+            'errors': self.errors,
+            'last_result': self.last_result,
+        }
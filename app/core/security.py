@@ -0,0 +1,69 @@
+# app/core/security.py
+"""
+JWT 액세스 토큰 발급/검증과 토큰에서 사용자를 꺼내는 의존성
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jose import JWTError, jwt
+
+from app.core.config import settings
+from app.schemas.schemas import TokenData
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+def create_access_token(user_id: int, expires_delta: Optional[timedelta] = None) -> str:
+    """
+    sub 클레임에 사용자 ID를 담은 액세스 토큰을 만듭니다.
+    """
+    if not settings.SECRET_KEY:
+        raise RuntimeError("SECRET_KEY가 설정되지 않았습니다.")
+    expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
+    claims = {'sub': str(user_id), 'exp': expire}
+    return jwt.encode(claims, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+
+def decode_access_token(token: str) -> TokenData:
+    """
+    토큰 서명과 만료를 검사합니다. 잘못된 토큰이면 ValueError.
+    """
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        raise ValueError("유효하지 않은 토큰입니다.")
+    user_id = payload.get('sub')
+    if user_id is None:
+        raise ValueError("유효하지 않은 토큰입니다.")
+    return TokenData(user_id=user_id)
+
+
+def get_token_user_id(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+) -> Optional[int]:
+    """
+    Authorization: Bearer 토큰이 있으면 사용자 ID를, 없으면 None을 반환하는 의존성.
+    토큰이 있는데 잘못되었으면 401.
+    """
+    if credentials is None:
+        return None
+    try:
+        return int(decode_access_token(credentials.credentials).user_id)
+    except ValueError as e:
+        raise HTTPException(401, detail=str(e), headers={"WWW-Authenticate": "Bearer"})
+
+
+def resolve_path_user(path_user_id: int, token_user_id: Optional[int]) -> bool:
+    """
+    경로의 user_id 와 토큰 사용자를 비교합니다.
+    - 토큰이 없으면 False (서비스에서 사용자 존재 여부를 확인)
+    - 같으면 True (토큰 발급 시 이미 확인된 사용자이므로 조회 생략)
+    - 다르면 403
+    """
+    if token_user_id is None:
+        return False
+    if token_user_id != path_user_id:
+        raise HTTPException(403, detail="다른 사용자의 요청은 처리할 수 없습니다.")
+    return True
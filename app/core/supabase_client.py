@@ -1,16 +1,148 @@
 # app/core/supabase_client.py
-from supabase import create_client, Client
+import threading
+from typing import Optional
+
+import httpx
+from supabase import create_client, Client, ClientOptions
 from .config import settings
 
-# 백엔드 전용 클라이언트는 service_role 키를 사용합니다.
-# 이 키는 데이터베이스의 모든 테이블에 대한 전체 접근 권한을 가집니다.
-supabase_admin: Client = create_client(
-    settings.SUPABASE_URL, 
-    settings.SUPABASE_SERVICE_KEY
-)
+
+class PoolMetrics:
+    """
+    진행 중인 요청 수를 세어 커넥션 풀 포화도를 추적합니다.
+    """
+
+    def __init__(self, max_connections: int):
+        self.max_connections = max_connections
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.requests = 0
+
+    def enter(self) -> None:
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def leave(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def stats(self) -> dict:
+        return {
+            'max_connections': self.max_connections,
+            'in_flight': self.in_flight,
+            'peak_in_flight': self.peak_in_flight,
+            'saturation': round(self.in_flight / self.max_connections, 3) if self.max_connections else None,
+            'requests': self.requests,
+        }
+
+
+class MeteredTransport(httpx.HTTPTransport):
+    """요청 전후로 PoolMetrics 를 갱신하는 httpx 전송 계층"""
+
+    def __init__(self, metrics: PoolMetrics, **kwargs):
+        super().__init__(**kwargs)
+        self.metrics = metrics
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.metrics.enter()
+        try:
+            return super().handle_request(request)
+        finally:
+            self.metrics.leave()
+
+
+class SupabaseClientFactory:
+    """
+    커넥션 풀(keep-alive, HTTP/2, 타임아웃)을 설정한 Supabase 클라이언트를 만들고 관리합니다.
+    FastAPI lifespan 에서 open()/close() 하며, 열리기 전에 요청되면 그 시점에 엽니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._admin: Optional[Client] = None
+        self._anon: Optional[Client] = None
+        self._http_clients = []
+        self.admin_metrics = PoolMetrics(settings.SUPABASE_MAX_CONNECTIONS)
+        self.anon_metrics = PoolMetrics(settings.SUPABASE_MAX_CONNECTIONS)
+
+    def _http_client(self, metrics: PoolMetrics) -> httpx.Client:
+        transport = MeteredTransport(
+            metrics,
+            limits=httpx.Limits(
+                max_connections=settings.SUPABASE_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.SUPABASE_MAX_KEEPALIVE,
+                keepalive_expiry=settings.SUPABASE_KEEPALIVE_EXPIRY,
+            ),
+            http2=settings.SUPABASE_HTTP2,
+        )
+        client = httpx.Client(
+            transport=transport,
+            timeout=httpx.Timeout(
+                settings.SUPABASE_TIMEOUT,
+                connect=settings.SUPABASE_CONNECT_TIMEOUT,
+                pool=settings.SUPABASE_POOL_TIMEOUT,
+            ),
+            follow_redirects=True,
+        )
+        self._http_clients.append(client)
+        return client
+
+    def _create(self, key: str, metrics: PoolMetrics) -> Client:
+        return create_client(
+            settings.SUPABASE_URL,
+            key,
+            options=ClientOptions(httpx_client=self._http_client(metrics)),
+        )
+
+    def open(self) -> None:
+        with self._lock:
+            if self._admin is None:
+                # 백엔드 전용 클라이언트는 service_role 키를 사용합니다.
+                # 이 키는 데이터베이스의 모든 테이블에 대한 전체 접근 권한을 가집니다.
+                self._admin = self._create(settings.SUPABASE_SERVICE_KEY, self.admin_metrics)
+            if self._anon is None and settings.SUPABASE_URL and settings.SUPABASE_KEY:
+                self._anon = self._create(settings.SUPABASE_KEY, self.anon_metrics)
+
+    def close(self) -> None:
+        with self._lock:
+            for client in self._http_clients:
+                client.close()
+            self._http_clients = []
+            self._admin = None
+            self._anon = None
+
+    def admin(self) -> Client:
+        if self._admin is None:
+            self.open()
+        return self._admin
+
+    def anon(self) -> Optional[Client]:
+        if self._admin is None:
+            self.open()
+        return self._anon
+
+    def stats(self) -> dict:
+        return {
+            'admin': self.admin_metrics.stats(),
+            'anon': self.anon_metrics.stats(),
+        }
+
+
+supabase_factory = SupabaseClientFactory()
+
 
 def get_supabase() -> Client:
     """
     API 엔드포인트에서 사용할 Supabase 클라이언트 의존성.
     """
-    return supabase_admin
+    return supabase_factory.admin()
+
+
+def get_supabase_anon() -> Optional[Client]:
+    """
+    anon 키를 사용하는 Supabase 클라이언트 의존성. (SUPABASE_KEY 미설정 시 None)
+    """
+    return supabase_factory.anon()
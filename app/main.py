@@ -1,9 +1,33 @@
 # app/main.py
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api import course, mbti, question, quiz, seaecosystem, seaemotion, user
+from app.api import course, mbti, metrics, question, quiz, seaecosystem, seaemotion, user
+from app.core.executor import db_executor, hash_executor
+from app.core.supabase_client import supabase_factory
+from app.core.config import settings
+from app.services.seamotion_service import sea_emotion_retention
+from app.services.seamotion_warmer import sea_emotion_warmer
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Supabase 클라이언트(커넥션 풀)는 앱 수명 동안 하나만 유지합니다.
+    supabase_factory.open()
+    # 알려진 지역의 바다 성격을 버킷이 바뀌기 전에 미리 계산해 둡니다.
+    # (API 키가 없으면 모든 지역을 임시 데이터로 채우게 되므로 예열하지 않습니다.)
+    if settings.SEA_EMOTION_PREWARM and settings.SEA_API_KEY:
+        sea_emotion_warmer.start(supabase_factory.admin())
+    # 보존 기간이 지난 sea_emotions 행을 주기적으로 배치 삭제합니다.
+    sea_emotion_retention.start(supabase_factory.admin())
+    yield
+    await sea_emotion_warmer.stop()
+    await sea_emotion_retention.stop()
+    supabase_factory.close()
+    db_executor.shutdown()
+    hash_executor.shutdown()
 
 app = FastAPI(
+    lifespan=lifespan,
     title="Ripple API",
     description="너의 진심이 물결(Ripple)처럼 번지는 곳, Reply(대답) + People(사람) + Ripple(파동)의 의미를 담은 서비스",
     version="0.1.0",
@@ -25,6 +49,7 @@ app.include_router(quiz.router, prefix="/api", tags=["quiz"])
 app.include_router(seaecosystem.router, prefix="/api", tags=["seaecosystem"])
 app.include_router(seaemotion.router, prefix="/api", tags=['seaemotion'])
 app.include_router(user.router, prefix="/api", tags=['user'])
+app.include_router(metrics.router, prefix="/api", tags=['metrics'])
 
 @app.get("/", tags=["Root"])
 async def read_root():
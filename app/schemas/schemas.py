@@ -1,6 +1,6 @@
 # app/schemas/user.py
 from pydantic import BaseModel, ConfigDict, Field
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict
 import uuid
 
 
@@ -10,6 +10,11 @@ class SignupRequest(BaseModel):
     password: str
 
 
+class LoginRequest(BaseModel):
+    name: str
+    password: str
+
+
 # mbti
 class Mbti(BaseModel):
     mbti: str = Field(...)
@@ -25,6 +30,7 @@ class QuestionItem(BaseModel):
 
 class QuestionListResponse(BaseModel):
     questions: List[QuestionItem]
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (limit 지정 시)
 
 class QuestionAnswer(BaseModel):
     answer: str
@@ -55,10 +61,13 @@ class Course(BaseModel):
     name: str
     totalDistance: float
     color: str
-    paths: List[Point]
+    paths: Optional[List[Point]] = None
+    polyline: Optional[str] = None  # geometry=polyline 요청 시 paths 대신 반환
+    distanceKm: Optional[float] = None  # 주변 코스 조회 시 기준점에서 시작점까지 거리
 
 class CourseListResponse(BaseModel):
     courses: List[Course]
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (limit 지정 시)
 
 
 # review
@@ -70,6 +79,14 @@ class ReviewItem(BaseModel):
 
 class ReviewListReponse(BaseModel):
     reviews: List[ReviewItem]
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (limit 지정 시)
+
+class ReviewSummaryResponse(BaseModel):
+    courseId: int
+    count: int
+    average: Optional[float] = None
+    histogram: Dict[int, int]  # 평점 -> 리뷰 수
+    keywords: Dict[str, int]   # 키워드 -> 등장 횟수
 
 
 # quiz
@@ -79,6 +96,9 @@ class QuizResponse(BaseModel):
     content: Any
     correct: int
 
+class QuizBatchResponse(BaseModel):
+    quizzes: List[QuizResponse]
+
 
 # global
 class Message(BaseModel):
@@ -1,128 +1,469 @@
 # app/services/course_service.py (기존 코드에 추가)
 from supabase import Client
+from postgrest.exceptions import APIError
 from app.schemas.schemas import *
-from typing import Optional, List
+from app.core.cache import SnapshotCache
+from app.core.config import settings
+from app.core import geometry
+from app.services.mbti_service import get_mbti_service
+from app.core.pagination import KEYSET_COLUMNS, apply_keyset, decode_cursor, encode_cursor, split_page, timestamp_key
+from app.core.projection import columns_for
+from pydantic import BaseModel
+from typing import Optional, List, Dict, Tuple, Type
 from datetime import datetime
+from array import array
+import threading
+import bisect
 
 def get_mbti(user_id: int, supabase: Client) -> Optional[str]:
     """
-    사용자의 MBTI를 조회합니다.
+    사용자의 MBTI를 조회합니다. (사용자 프로필 캐시 공유)
     """
-    try:
-        response = supabase.table('users').select('mbti').eq('id', user_id).execute()
-        
-        if response.data and len(response.data) > 0:
-            return response.data[0]['mbti']
-        return None
-    except Exception as e:
-        print(f"MBTI 찾기 실패 > {user_id}: {e}")
-        return None
+    return get_mbti_service(user_id, supabase)
 
 COMMON_COURSE_COLOR = "#8FA1FF"
 
-def _try_select_variants(table_name: str, supabase: Client, variants: list, filters: dict = None):
+# DB 함수가 "대상 없음"을 알릴 때 사용하는 SQLSTATE (no_data_found)
+PG_NO_DATA_FOUND = 'P0002'
+# UNIQUE 제약 위반 SQLSTATE
+PG_UNIQUE_VIOLATION = '23505'
+
+# 테이블별로 처음 성공한 컬럼 표기법(select / order)을 기억해 두는 캐시
+# key: (용도, 테이블명, 후보 표기법 튜플) -> 성공한 표기법
+_dialect_cache: Dict[tuple, str] = {}
+
+NO_ORDER = ''  # order 없이 조회하는 경우를 나타내는 표기
+
+def _probe_variants(cache_key: tuple, variants: list, run, accept):
     """
-    select 문자열 표기(큰따옴표 포함/미포함 등)를 여러가지로 시도해서 데이터가 반환되는 첫 결과를 리턴합니다.
-    filters: {'field': value, ...} 형태로 eq 필터들을 전달 가능 (선택).
+    기억해 둔 표기법이 있으면 바로 한 번만 조회합니다.
+    그 조회가 실패(예외)했을 때만 캐시를 지우고 후보 표기법을 처음부터 다시 시도합니다.
+    run(variant) -> resp, accept(resp) -> 성공 여부
     """
-    for sel in variants:
+    learned = _dialect_cache.get(cache_key)
+    if learned is not None:
         try:
-            q = supabase.table(table_name).select(sel)
-            if filters:
-                for k, v in filters.items():
-                    q = q.eq(k, v)
-            resp = q.execute()
-            if getattr(resp, "data", None):
-                return resp
+            return run(learned)
+        except Exception:
+            _dialect_cache.pop(cache_key, None)
+
+    for variant in variants:
+        try:
+            resp = run(variant)
         except Exception:
             # 시도 중 에러나 실패는 무시하고 다음 표기법 시도
             continue
+        if accept(resp):
+            _dialect_cache[cache_key] = variant
+            return resp
     return None
 
+def reset_dialect_cache() -> None:
+    """
+    기억해 둔 표기법을 모두 지웁니다. (스키마 변경 후 재탐색용)
+    """
+    _dialect_cache.clear()
+
+def _has_data(resp) -> bool:
+    return bool(getattr(resp, "data", None))
+
+def _try_select_variants(table_name: str, supabase: Client, variants: list, filters: dict = None,
+                         window: Optional[Tuple[int, int]] = None):
+    """
+    select 문자열 표기(큰따옴표 포함/미포함 등)를 여러가지로 시도해서 데이터가 반환되는 첫 결과를 리턴합니다.
+    성공한 표기법은 테이블별로 기억해서 다음 호출부터는 바로 사용합니다.
+    filters: {'field': value, ...} 형태로 eq 필터들을 전달 가능 (선택).
+             value가 list/tuple/set이면 in_ 필터로 전달됩니다.
+    window: (start, end) 를 주면 id 순으로 정렬해 그 범위의 행만 조회합니다. (페이지 조회용)
+    """
+    def run(sel):
+        q = supabase.table(table_name).select(sel)
+        if filters:
+            for k, v in filters.items():
+                q = q.in_(k, list(v)) if isinstance(v, (list, tuple, set)) else q.eq(k, v)
+        if window is not None:
+            q = q.order('id').range(*window)
+        return q.execute()
+
+    return _probe_variants(('select', table_name, tuple(variants)), variants, run, _has_data)
+
+ORDER_VARIANTS = ['"order"', 'order', NO_ORDER]
+
 def _try_order_variants(table, select_str, supabase: Client, course_id):
     """
     order 필드 표기도 여러가지로 시도해서 경로 데이터를 반환합니다.
+    모두 실패하면 order 없이 select 만 시도합니다. 성공한 표기법은 테이블별로 기억합니다.
     """
-    order_variants = ['"order"', 'order']
-    for ord_field in order_variants:
-        try:
-            resp = supabase.table(table)\
-                .select(select_str)\
-                .eq('courseId', course_id)\
-                .order(ord_field, asc=True)\
-                .execute()
-            if getattr(resp, "data", None):
-                return resp
-        except Exception:
-            continue
-    # 마지막으로 order 없이 그냥 select 만 시도
-    try:
-        resp = supabase.table(table).select(select_str).eq('courseId', course_id).execute()
-        if getattr(resp, "data", None):
-            return resp
-    except Exception:
-        pass
-    return None
+    def run(ord_field):
+        q = supabase.table(table).select(select_str).eq('courseId', course_id)
+        if ord_field:
+            q = q.order(ord_field)
+        return q.execute()
+
+    return _probe_variants(('order', table, tuple(ORDER_VARIANTS)), ORDER_VARIANTS, run, _has_data)
+
+COURSE_SELECT_VARIANTS = ['id, name, "totalDistance", created_at', 'id, name, totalDistance, created_at', '*']
 
-def get_all_courses_service(supabase: Client) -> List[dict]:
+PATH_PAGE_SIZE = 1000  # PostgREST 기본 max-rows 에 맞춘 페이지 크기
+# 서버의 max-rows 가 페이지 크기보다 작으면 요청보다 적은 행이 오므로,
+# 페이지 조회는 실제로 받은 행 수만큼 다음 시작 위치를 옮기고 빈 페이지가 올 때만 멈춥니다.
+
+def _fetch_paths_page(supabase: Client, select_str: str, start: int, end: int, course_ids: Optional[List[int]] = None):
+    """
+    course_paths 한 페이지를 courseId, order 순으로 조회합니다.
+    course_ids가 주어지면 해당 코스들의 경로만 in_ 필터로 조회합니다.
+    order 표기법은 _try_order_variants 와 같은 캐시를 사용하고,
+    모두 실패하면 courseId 순서만 보장합니다.
+    페이지 경계가 흔들리지 않도록 마지막에 항상 id 로 정렬합니다.
+    """
+    def run(ord_field):
+        q = supabase.table('course_paths').select(select_str)
+        if course_ids is not None:
+            q = q.in_('courseId', course_ids)
+        q = q.order('courseId')
+        if ord_field:
+            q = q.order(ord_field)
+        return q.order('id').range(start, end).execute()
+
+    return _probe_variants(('order', 'course_paths', tuple(ORDER_VARIANTS)), ORDER_VARIANTS, run, lambda resp: True)
+
+def _fetch_paths_grouped(supabase: Client, page_size: int = PATH_PAGE_SIZE, course_ids: Optional[List[int]] = None) -> Dict[int, array]:
+    """
+    course_paths 전체(또는 course_ids 코스들)를 페이지 단위로 한꺼번에 조회한 뒤 courseId 별로 묶습니다.
+    코스 수와 상관없이 ceil(경로 행 수 / page_size) + 1 번만 조회합니다.
+    좌표는 코스별로 [lat0, lng0, lat1, lng1, ...] 형태의 array('d') 에 담습니다.
+    """
+    grouped: Dict[int, array] = {}
+    start = 0
+    while True:
+        resp = _fetch_paths_page(supabase, 'courseId, latitude, longitude', start, start + page_size - 1, course_ids)
+        rows = resp.data if resp and getattr(resp, "data", None) else []
+        if not rows:
+            break
+        for p in rows:
+            coords = grouped.get(p['courseId'])
+            if coords is None:
+                coords = grouped[p['courseId']] = array('d')
+            coords.append(float(p['latitude']))
+            coords.append(float(p['longitude']))
+        start += len(rows)
+    return grouped
+
+class CourseRecord:
+    """
+    메모리에 보관되는 코스 한 건
+    경로 좌표는 array('d') 에 [lat, lng, lat, lng, ...] 순서로 담고,
+    응답 직전에 to_dict() 로만 dict/list 형태로 변환합니다.
+    줌 레벨별로 단순화한 경로는 _simplified, 인코딩한 폴리라인은 _polylines 에 보관해 재사용합니다.
+    """
+    __slots__ = ('course_id', 'name', 'total_distance', 'color', 'coords', 'created_at', '_simplified', '_polylines')
+
+    def __init__(self, course_id: int, name: str, total_distance: float, color: str, coords: array,
+                 created_at: Optional[str] = None):
+        self.course_id = course_id
+        self.name = name
+        self.total_distance = total_distance
+        self.color = color
+        self.coords = coords
+        self.created_at = created_at
+        self._simplified: Dict[int, array] = {}
+        self._polylines: Dict[Optional[int], str] = {}
+
+    @classmethod
+    def from_row(cls, course: dict, coords: Optional[array]) -> "CourseRecord":
+        return cls(
+            course.get('id'),
+            course.get('name'),
+            course.get('totalDistance'),
+            COMMON_COURSE_COLOR,
+            coords if coords is not None else array('d'),
+            course.get('created_at'),
+        )
+
+    def sort_key(self) -> tuple:
+        return (timestamp_key(self.created_at), self.course_id)
+
+    def start_point(self) -> Optional[tuple]:
+        if len(self.coords) < 2:
+            return None
+        return (self.coords[0], self.coords[1])
+
+    def coords_for(self, zoom: Optional[int] = None, tolerance: Optional[float] = None) -> array:
+        """
+        zoom 또는 tolerance(도 단위)에 맞게 단순화한 좌표를 반환합니다. 둘 다 없으면 원본 좌표.
+        zoom 결과는 레코드에 캐시되고, 임의의 tolerance 는 매번 계산합니다.
+        """
+        if zoom is not None:
+            simplified = self._simplified.get(zoom)
+            if simplified is None:
+                simplified = self._simplified[zoom] = geometry.simplify(self.coords, geometry.zoom_to_tolerance(zoom))
+            return simplified
+        if tolerance is not None:
+            return geometry.simplify(self.coords, tolerance)
+        return self.coords
+
+    def points(self, zoom: Optional[int] = None, tolerance: Optional[float] = None) -> List[dict]:
+        coords = self.coords_for(zoom, tolerance)
+        return [{"lat": coords[i], "lng": coords[i + 1]} for i in range(0, len(coords), 2)]
+
+    def polyline(self, zoom: Optional[int] = None, tolerance: Optional[float] = None) -> str:
+        if tolerance is not None and zoom is None:
+            return geometry.encode_polyline(self.coords_for(None, tolerance))
+        encoded = self._polylines.get(zoom)
+        if encoded is None:
+            encoded = self._polylines[zoom] = geometry.encode_polyline(self.coords_for(zoom))
+        return encoded
+
+    def to_dict(self, zoom: Optional[int] = None, tolerance: Optional[float] = None,
+                geometry_format: str = geometry.GEOMETRY_POINTS) -> dict:
+        course = {
+            'courseId': self.course_id,
+            'name': self.name,
+            'totalDistance': self.total_distance,
+            'color': self.color,
+        }
+        if geometry_format == geometry.GEOMETRY_POLYLINE:
+            course['polyline'] = self.polyline(zoom, tolerance)
+        else:
+            course['paths'] = self.points(zoom, tolerance)
+        return course
+
+def _fetch_course_rows(supabase: Client, page_size: int = PATH_PAGE_SIZE, filters: dict = None) -> List[dict]:
+    """
+    courses 를 id 순으로 페이지 단위로 모두 조회합니다. (max-rows 로 잘리지 않도록)
+    """
+    rows: List[dict] = []
+    start = 0
+    while True:
+        resp = _try_select_variants('courses', supabase, COURSE_SELECT_VARIANTS, filters=filters,
+                                    window=(start, start + page_size - 1))
+        page = resp.data if resp and getattr(resp, "data", None) else []
+        if not page:
+            break
+        rows.extend(page)
+        start += len(page)
+    return rows
+
+def load_course_catalog(supabase: Client, page_size: int = PATH_PAGE_SIZE) -> List[CourseRecord]:
+    """
+    모든 코스와 경로를 일괄 조회하여 코스 목록을 만듭니다.
+    코스/경로 페이지 수만큼만 조회하므로 코스별 경로 조회(N+1)가 발생하지 않습니다.
+    """
+    rows = _fetch_course_rows(supabase, page_size)
+    if not rows:
+        return []
+
+    paths_by_course = _fetch_paths_grouped(supabase, page_size)
+
+    return [CourseRecord.from_row(course, paths_by_course.get(course.get('id'))) for course in rows]
+
+def _fetch_courses_by_ids(course_ids: List[int], supabase: Client) -> List[CourseRecord]:
+    """
+    여러 코스를 courses / course_paths 페이지 수만큼의 in_ 조회로 가져옵니다.
+    """
+    rows = _fetch_course_rows(supabase, filters={'id': course_ids})
+    if not rows:
+        return []
+
+    paths_by_course = _fetch_paths_grouped(supabase, course_ids=course_ids)
+    return [CourseRecord.from_row(course, paths_by_course.get(course.get('id'))) for course in rows]
+
+class CourseCatalog:
+    """
+    카탈로그 캐시에 보관되는 코스 목록과 id 색인
+    ordered/keys 는 (created_at, id) 오름차순 정렬로, 키셋 페이지 조회에 사용합니다.
+    """
+    __slots__ = ('courses', 'by_id', 'ordered', 'keys')
+
+    def __init__(self, courses: List[CourseRecord]):
+        self.courses = courses
+        self.by_id = {c.course_id: c for c in courses}
+        self.ordered = sorted(courses, key=CourseRecord.sort_key)
+        self.keys = [c.sort_key() for c in self.ordered]
+
+    def page(self, limit: int, cursor: Optional[str] = None) -> Tuple[List[CourseRecord], Optional[str]]:
+        start = 0
+        if cursor:
+            created_at, course_id = decode_cursor(cursor)
+            start = bisect.bisect_right(self.keys, (created_at, course_id))
+        page = self.ordered[start:start + limit]
+        if start + limit >= len(self.ordered) or not page:
+            return page, None
+        return page, encode_cursor(*self.keys[start + len(page) - 1])
+
+def _build_course_catalog(supabase: Client) -> CourseCatalog:
+    return CourseCatalog(load_course_catalog(supabase))
+
+_course_catalog = SnapshotCache('course_catalog', _build_course_catalog, settings.COURSE_CATALOG_TTL_SECONDS)
+
+def invalidate_course_catalog() -> None:
+    """
+    코스/경로 데이터가 바뀌었을 때 호출합니다. 다음 조회 시 카탈로그를 새로 불러옵니다.
+    """
+    _course_catalog.invalidate()
+
+def _refresh_catalog_for_new_courses(supabase: Client) -> None:
+    """
+    카탈로그에 없는 코스가 DB에서 발견되었을 때 호출합니다.
+    스냅샷이 COURSE_CATALOG_MIN_REFRESH_SECONDS 보다 오래되었을 때만 백그라운드에서 다시 불러오므로,
+    같은 코스를 반복 조회해도 카탈로그를 매번 버리거나 다음 조회가 전체 재적재를 기다리지 않습니다.
+    """
+    _course_catalog.refresh_if_older_than(settings.COURSE_CATALOG_MIN_REFRESH_SECONDS, supabase)
+
+def course_catalog_stats() -> dict:
+    """
+    카탈로그 캐시의 버전, 적중/미적중 횟수 등을 반환합니다.
+    """
+    return _course_catalog.stats()
+
+class CourseSpatialIndex:
+    """
+    코스 시작점 격자 색인
+    카탈로그 스냅샷 버전이 바뀌면 추가/삭제/시작점이 바뀐 코스만 색인에 반영합니다.
+    """
+
+    def __init__(self, cell_deg: float = 0.05):
+        self._grid = geometry.GridIndex(cell_deg)
+        self._version = None
+        self._lock = threading.Lock()
+
+    def sync(self, snapshot) -> None:
+        if snapshot.version == self._version:
+            return
+        with self._lock:
+            if snapshot.version == self._version:
+                return
+            by_id = snapshot.value.by_id
+            for course_id in [k for k in self._grid.keys() if k not in by_id]:
+                self._grid.remove(course_id)
+            for course_id, course in by_id.items():
+                start = course.start_point()
+                if start is None:
+                    self._grid.remove(course_id)
+                elif self._grid.get(course_id) != start:
+                    self._grid.add(course_id, *start)
+            self._version = snapshot.version
+
+    def query(self, lat: float, lng: float, radius_km: float) -> list:
+        with self._lock:
+            return self._grid.query(lat, lng, radius_km)
+
+_course_index = CourseSpatialIndex()
+
+def get_all_courses_service(supabase: Client, zoom: Optional[int] = None, tolerance: Optional[float] = None,
+                            geometry_format: str = geometry.GEOMETRY_POINTS) -> List[dict]:
     """
     모든 코스를 조회합니다. 코스 전체 경로(path)를 포함합니다.
-    여러 select 표기법을 시도하여 데이터가 정상적으로 반환되도록 합니다.
+    카탈로그 캐시에서 읽고, 캐시가 비어 있으면 load_course_catalog 로 일괄 조회합니다.
+    zoom/tolerance가 주어지면 경로를 단순화해서 반환합니다.
+    geometry_format이 polyline이면 paths 대신 인코딩된 polyline 문자열을 반환합니다.
     """
     try:
-        select_variants = ['id, name, "totalDistance"', 'id, name, totalDistance', '*']
-        resp = _try_select_variants('courses', supabase, select_variants)
-        if not resp or not getattr(resp, "data", None):
-            # 데이터가 없으면 빈 리스트 반환
-            return []
+        return [c.to_dict(zoom, tolerance, geometry_format) for c in _course_catalog.get(supabase).value.courses]
+    except Exception as e:
+        print(f"코스 목록 조회 실패: {e}")
+        return []
 
-        courses = []
-        for course in resp.data:
-            # 경로 조회: order 표기법을 여러가지로 시도
-            paths_resp = _try_order_variants('course_paths', 'latitude, longitude', supabase, course.get('id'))
-            paths = [
-                {"lat": float(p['latitude']), "lng": float(p['longitude'])}
-                for p in (paths_resp.data if paths_resp and getattr(paths_resp, "data", None) else [])
-            ]
-
-            courses.append({
-                'courseId': course.get('id'),
-                'name': course.get('name'),
-                'totalDistance': course.get('totalDistance'),
-                'color': COMMON_COURSE_COLOR,
-                'paths': paths
-            })
+def get_courses_page_service(supabase: Client, limit: int, cursor: Optional[str] = None,
+                             zoom: Optional[int] = None, tolerance: Optional[float] = None,
+                             geometry_format: str = geometry.GEOMETRY_POINTS) -> Tuple[List[dict], Optional[str]]:
+    """
+    코스를 (created_at, id) 오름차순으로 limit개씩 반환합니다. (코스 목록, next_cursor)
+    카탈로그 캐시의 정렬된 목록에서 이분 탐색하므로 페이지 깊이와 무관하게 비용이 같습니다.
+    잘못된 커서는 ValueError.
+    """
+    if cursor:
+        decode_cursor(cursor)
+    try:
+        page, next_cursor = _course_catalog.get(supabase).value.page(limit, cursor)
+        return [c.to_dict(zoom, tolerance, geometry_format) for c in page], next_cursor
+    except Exception as e:
+        print(f"코스 목록 조회 실패: {e}")
+        return [], None
 
+def get_nearby_courses_service(lat: float, lng: float, radius_km: float, supabase: Client,
+                               zoom: Optional[int] = None, geometry_format: str = geometry.GEOMETRY_POINTS) -> List[dict]:
+    """
+    (lat, lng) 에서 radius_km 이내에서 시작하는 코스를 가까운 순으로 반환합니다.
+    카탈로그 캐시 위의 시작점 격자 색인만 사용하므로 DB를 조회하지 않습니다.
+    """
+    try:
+        snap = _course_catalog.get(supabase)
+        _course_index.sync(snap)
+        by_id = snap.value.by_id
+        courses = []
+        for dist, course_id in _course_index.query(lat, lng, radius_km):
+            course = by_id.get(course_id)
+            if course is None:
+                continue
+            item = course.to_dict(zoom, None, geometry_format)
+            item['distanceKm'] = round(dist, 3)
+            courses.append(item)
         return courses
     except Exception as e:
-        print(f"코스 목록 조회 실패: {e}")
+        print(f"주변 코스 조회 실패: {e}")
         return []
 
-def get_course_by_id_service(course_id: int, supabase: Client) -> Optional[dict]:
+def get_course_by_id_service(course_id: int, supabase: Client,
+                             geometry_format: str = geometry.GEOMETRY_POINTS) -> Optional[dict]:
     """
-    특정 코스의 상세 정보를 조회합니다. 여러 select 표기법과 order 표기를 시도합니다.
+    특정 코스의 상세 정보를 조회합니다.
+    카탈로그 캐시에 없는 코스(캐시 이후 추가된 코스 등)만 DB에서 직접 조회합니다.
     """
     try:
-        select_variants = ['id, name, "totalDistance"', 'id, name, totalDistance', '*']
-        resp = _try_select_variants('courses', supabase, select_variants, filters={'id': course_id})
-        if not resp or not getattr(resp, "data", None) or len(resp.data) == 0:
-            return None
+        course = _course_catalog.get(supabase).value.by_id.get(course_id)
+        if course is not None:
+            return course.to_dict(geometry_format=geometry_format)
+    except Exception as e:
+        print(f"코스 카탈로그 조회 실패: {e}")
 
-        course = resp.data[0]
+    course = _fetch_course_by_id(course_id, supabase)
+    if course is not None:
+        # 캐시 이후에 추가된 코스일 수 있으므로 카탈로그 갱신을 요청합니다. (빈도 제한)
+        _refresh_catalog_for_new_courses(supabase)
+        return course.to_dict(geometry_format=geometry_format)
+    return None
 
-        paths_resp = _try_order_variants('course_paths', 'latitude, longitude', supabase, course_id)
-        paths = [
-            {"lat": float(p['latitude']), "lng": float(p['longitude'])}
-            for p in (paths_resp.data if paths_resp and getattr(paths_resp, "data", None) else [])
-        ]
+def get_courses_by_ids_service(course_ids: List[int], supabase: Client, zoom: Optional[int] = None, tolerance: Optional[float] = None,
+                               geometry_format: str = geometry.GEOMETRY_POINTS) -> List[dict]:
+    """
+    여러 코스의 상세 정보를 요청한 id 순서대로 조회합니다.
+    카탈로그 캐시에 없는 코스들만 in_ 필터로 한 번에 DB에서 조회합니다.
+    zoom/tolerance가 주어지면 경로를 단순화해서 반환합니다.
+    """
+    course_ids = list(dict.fromkeys(course_ids))
+    if not course_ids:
+        return []
 
-        return {
-            'courseId': course.get('id'),
-            'name': course.get('name'),
-            'totalDistance': course.get('totalDistance'),
-            'color': COMMON_COURSE_COLOR,
-            'paths': paths
-        }
+    found: Dict[int, CourseRecord] = {}
+    try:
+        by_id = _course_catalog.get(supabase).value.by_id
+        found = {cid: by_id[cid] for cid in course_ids if cid in by_id}
+    except Exception as e:
+        print(f"코스 카탈로그 조회 실패: {e}")
+
+    missing = [cid for cid in course_ids if cid not in found]
+    if missing:
+        try:
+            fetched = _fetch_courses_by_ids(missing, supabase)
+        except Exception as e:
+            print(f"코스 일괄 조회 실패: {e}")
+            fetched = []
+        if fetched:
+            # 캐시 이후에 추가된 코스가 있으므로 카탈로그 갱신을 요청합니다. (빈도 제한)
+            _refresh_catalog_for_new_courses(supabase)
+        for course in fetched:
+            found[course.course_id] = course
+
+    return [found[cid].to_dict(zoom, tolerance, geometry_format) for cid in course_ids if cid in found]
+
+def _fetch_course_by_id(course_id: int, supabase: Client) -> Optional[CourseRecord]:
+    """
+    특정 코스의 상세 정보를 DB에서 조회합니다. 여러 select 표기법과 order 표기를 시도합니다.
+    """
+    try:
+        courses = _fetch_courses_by_ids([course_id], supabase)
+        return courses[0] if courses else None
 
     except Exception as e:
         print(f"코스 상세 조회 실패: {e}")
@@ -142,41 +483,38 @@ def recommend_course(mbti: str, sea_emotion: SeaEmotionRequest, supabase: Client
         print(f"코스 추천 실패: {e}")
         return []
 
+def _rating_to_int(rating) -> int:
+    # rating을 DB 정수 타입에 맞게 변환 (반올림)
+    try:
+        return int(round(float(rating)))
+    except Exception:
+        return int(rating)  # fallback
+
 def create_review_service(user_id: int, course_id: int, review_data: ReviewItem, supabase: Client) -> dict:
     """
     새로운 리뷰를 생성합니다.
+    (userId, courseId) UNIQUE 제약으로 중복을 막으므로 사전 조회 없이 바로 INSERT 합니다.
     """
     try:
-        # 이미 리뷰가 있는지 확인
-        existing = supabase.table('reviews')\
-            .select('id')\
-            .eq('userId', user_id)\
-            .eq('courseId', course_id)\
-            .execute()
-        
-        if existing.data and len(existing.data) > 0:
-            raise ValueError("이미 이 코스에 대한 리뷰를 작성하셨습니다.")
-        
-        # rating을 DB 정수 타입에 맞게 변환 (반올림)
-        try:
-            rating_int = int(round(float(review_data.rating)))
-        except Exception:
-            rating_int = int(review_data.rating)  # fallback
-        
         # 리뷰 데이터 준비
         review_insert = {
             'userId': user_id,
             'courseId': course_id,
             'title': review_data.title,
             'keyword': review_data.keyword,
-            'rating': rating_int,
+            'rating': _rating_to_int(review_data.rating),
             'content': review_data.content,
             'created_at': datetime.now().isoformat(),
             'updated_at': datetime.now().isoformat()
         }
         
         # 리뷰 삽입
-        response = supabase.table('reviews').insert(review_insert).execute()
+        try:
+            response = supabase.table('reviews').insert(review_insert).execute()
+        except APIError as e:
+            if e.code == PG_UNIQUE_VIOLATION:
+                raise ValueError("이미 이 코스에 대한 리뷰를 작성하셨습니다.") from e
+            raise
         
         if response.data and len(response.data) > 0:
             return response.data[0]
@@ -190,29 +528,14 @@ def create_review_service(user_id: int, course_id: int, review_data: ReviewItem,
 def update_review_service(user_id: int, course_id: int, review_data: ReviewItem, supabase: Client) -> dict:
     """
     기존 리뷰를 수정합니다.
+    사전 조회 없이 UPDATE 하고, 수정된 행이 없으면 리뷰가 없는 것으로 봅니다.
     """
     try:
-        # 리뷰 존재 여부 확인
-        existing = supabase.table('reviews')\
-            .select('id')\
-            .eq('userId', user_id)\
-            .eq('courseId', course_id)\
-            .execute()
-        
-        if not existing.data or len(existing.data) == 0:
-            raise ValueError("수정할 리뷰가 존재하지 않습니다.")
-        
-        # rating을 DB 정수 타입에 맞게 변환 (반올림)
-        try:
-            rating_int = int(round(float(review_data.rating)))
-        except Exception:
-            rating_int = int(review_data.rating)  # fallback
-        
         # 리뷰 업데이트 데이터 준비
         review_update = {
             'title': review_data.title,
             'keyword': review_data.keyword,
-            'rating': rating_int,
+            'rating': _rating_to_int(review_data.rating),
             'content': review_data.content,
             'updated_at': datetime.now().isoformat()
         }
@@ -224,10 +547,10 @@ def update_review_service(user_id: int, course_id: int, review_data: ReviewItem,
             .eq('courseId', course_id)\
             .execute()
         
-        if response.data and len(response.data) > 0:
-            return response.data[0]
-        else:
-            raise Exception("리뷰 수정에 실패했습니다.")
+        if not response.data or len(response.data) == 0:
+            raise ValueError("수정할 리뷰가 존재하지 않습니다.")
+
+        return response.data[0]
             
     except Exception as e:
         print(f"후기 수정 실패: {e}")
@@ -236,18 +559,9 @@ def update_review_service(user_id: int, course_id: int, review_data: ReviewItem,
 def delete_review_service(user_id: int, course_id: int, supabase: Client) -> bool:
     """
     리뷰를 삭제합니다.
+    사전 조회 없이 DELETE 하고, 삭제된 행이 없으면 리뷰가 없는 것으로 봅니다.
     """
     try:
-        # 리뷰 존재 여부 확인
-        existing = supabase.table('reviews')\
-            .select('id')\
-            .eq('userId', user_id)\
-            .eq('courseId', course_id)\
-            .execute()
-        
-        if not existing.data or len(existing.data) == 0:
-            raise ValueError("삭제할 리뷰가 존재하지 않습니다.")
-        
         # 리뷰 삭제
         response = supabase.table('reviews')\
             .delete()\
@@ -255,34 +569,50 @@ def delete_review_service(user_id: int, course_id: int, supabase: Client) -> boo
             .eq('courseId', course_id)\
             .execute()
         
+        if not response.data or len(response.data) == 0:
+            raise ValueError("삭제할 리뷰가 존재하지 않습니다.")
+
         return True
             
     except Exception as e:
         print(f"후기 삭제 실패: {e}")
         raise e
 
-def get_reviews_by_course(course_id: int, supabase: Client) -> List[dict]:
+def get_reviews_page(course_id: int, supabase: Client, limit: Optional[int] = None,
+                     cursor: Optional[str] = None, model: Optional[Type[BaseModel]] = None) -> Tuple[List[dict], Optional[str]]:
     """
-    특정 코스의 모든 리뷰를 조회합니다.
+    특정 코스의 리뷰를 최신순((created_at, id) 내림차순)으로 조회합니다. (리뷰 목록, next_cursor)
+    limit이 없으면 전체를 반환합니다. 잘못된 커서는 ValueError.
+    model이 주어지면 그 필드에 해당하는 컬럼만 조회합니다. (users 조인 없음)
     """
+    if cursor:
+        decode_cursor(cursor)
     try:
-        response = supabase.table('reviews')\
-            .select('*, users(id, name)')\
-            .eq('courseId', course_id)\
-            .order('created_at', desc=True)\
-            .execute()
-        
-        return response.data if response.data else []
-            
+        columns = columns_for(model, KEYSET_COLUMNS) if model else '*, users(id, name)'
+        query = supabase.table('reviews')\
+            .select(columns)\
+            .eq('courseId', course_id)
+        response = apply_keyset(query, cursor, limit).execute()
+
+        return split_page(response.data if response.data else [], limit)
+
     except Exception as e:
         print(f"후기 조회 실패: {e}")
-        return []
+        return [], None
+
+def get_reviews_by_course(course_id: int, supabase: Client) -> List[dict]:
+    """
+    특정 코스의 모든 리뷰를 조회합니다.
+    """
+    reviews, _ = get_reviews_page(course_id, supabase)
+    return reviews
 
-def get_completed_courses_service(user_id: int, supabase: Client) -> List[dict]:
+def get_completed_courses_service(user_id: int, supabase: Client, zoom: Optional[int] = None, tolerance: Optional[float] = None,
+                                  geometry_format: str = geometry.GEOMETRY_POINTS) -> List[dict]:
     """
     특정 사용자가 완료한 코스 목록을 반환합니다.
     completed_courses 테이블을 조회하여 course_id 목록을 얻은 뒤,
-    각 코스의 상세(get_course_by_id_service)을 호출합니다.
+    get_courses_by_ids_service 로 코스 상세를 한 번에 조회합니다.
     (디버그 로그 및 다양한 키/타입 처리 추가)
     """
     try:
@@ -326,66 +656,40 @@ def get_completed_courses_service(user_id: int, supabase: Client) -> List[dict]:
         if not course_ids:
             return []
 
-        courses = []
-        for cid in course_ids:
-            course = get_course_by_id_service(cid, supabase)
-            if course:
-                courses.append(course)
-
-        return courses
+        return get_courses_by_ids_service(course_ids, supabase, zoom, tolerance, geometry_format)
     except Exception as e:
         print(f"완료된 코스 조회 실패 (user_id={user_id}): {e}")
         return []
 
+def _raise_not_found(e: Exception) -> None:
+    """
+    DB 함수가 P0002(no_data_found)로 알린 오류는 ValueError 로 바꿔 404 로 응답되도록 합니다.
+    """
+    if isinstance(e, APIError) and e.code == PG_NO_DATA_FOUND:
+        raise ValueError(e.message) from e
+
 def start_course_service(user_id: int, course_id: int, supabase: Client) -> None:
     """
     코스 시작
     - completed_courses에 기존 기록이 있으면 삭제
+    - 유효성 체크와 삭제를 start_course DB 함수 한 번의 호출로 처리
     """
     try:
-        # 유효성 체크
-        course = supabase.table('courses').select('id').eq('id', course_id).execute()
-        if not course.data:
-            raise ValueError("존재하지 않는 코스입니다.")
-
-        user = supabase.table('users').select('id').eq('id', user_id).execute()
-        if not user.data:
-            raise ValueError("존재하지 않는 사용자입니다.")
-
-        # 기존 완료 기록 삭제 (있어도 되고 없어도 됨)
-        supabase.table('completed_courses')\
-            .delete()\
-            .eq('userId', user_id)\
-            .eq('courseId', course_id)\
-            .execute()
+        supabase.rpc('start_course', {'p_user_id': user_id, 'p_course_id': course_id}).execute()
 
     except Exception as e:
         print(f"코스 시작 실패 (user_id={user_id}, course_id={course_id}): {e}")
+        _raise_not_found(e)
         raise e
 
 def finish_course_service(user_id: int, course_id: int, supabase: Client) -> dict:
     """
     코스 종료
     - completed_courses에 INSERT
+    - 유효성 체크와 INSERT를 finish_course DB 함수 한 번의 호출로 처리
     """
     try:
-        # 유효성 체크
-        course = supabase.table('courses').select('id').eq('id', course_id).execute()
-        if not course.data:
-            raise ValueError("존재하지 않는 코스입니다.")
-
-        user = supabase.table('users').select('id').eq('id', user_id).execute()
-        if not user.data:
-            raise ValueError("존재하지 않는 사용자입니다.")
-
-        insert_data = {
-            "userId": user_id,
-            "courseId": course_id,
-            "completed_at": datetime.now().isoformat()
-        }
-
-        # UNIQUE 제약 때문에 중복 시 에러 → start에서 이미 정리됨
-        resp = supabase.table('completed_courses').insert(insert_data).execute()
+        resp = supabase.rpc('finish_course', {'p_user_id': user_id, 'p_course_id': course_id}).execute()
 
         if not resp.data:
             raise Exception("코스 완료 저장 실패")
@@ -394,4 +698,5 @@ def finish_course_service(user_id: int, course_id: int, supabase: Client) -> dic
 
     except Exception as e:
         print(f"코스 종료 실패 (user_id={user_id}, course_id={course_id}): {e}")
+        _raise_not_found(e)
         raise e
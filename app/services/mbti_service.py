@@ -1,47 +1,71 @@
 # app/services/mbti_service.py
+"""
+사용자 프로필(MBTI) 조회/저장 서비스
+users 조회 결과는 사용자 ID별 캐시에 보관하고, 저장 시 캐시도 함께 갱신합니다(write-through).
+"""
 from supabase import Client
 from typing import Optional
 from datetime import datetime
+from app.core.cache import LRUCache, MISSING
+from app.core.config import settings
+
+# 사용자 ID -> {'mbti': ...}
+# 다른 워커 프로세스에서 저장한 값은 보이지 않으므로 TTL이 지나면 다시 읽습니다.
+user_profiles = LRUCache('user_profile', settings.USER_PROFILE_CACHE_SIZE, settings.USER_PROFILE_TTL_SECONDS)
+
+
+def get_user_profile(user_id: int, supabase: Client) -> Optional[dict]:
+    """
+    사용자 프로필을 캐시에서 찾고, 없으면 DB에서 읽어 캐시에 넣습니다.
+    사용자가 없으면 None (캐시하지 않음)
+    """
+    profile = user_profiles.get(user_id)
+    if profile is not MISSING:
+        return profile
+
+    response = supabase.table('users')\
+        .select('mbti')\
+        .eq('id', user_id)\
+        .execute()
+
+    if not response.data:
+        return None
+    profile = {'mbti': response.data[0].get('mbti')}
+    user_profiles.set(user_id, profile)
+    return profile
+
+
+def user_profile_stats() -> dict:
+    return user_profiles.stats()
+
 
 def save_mbti_service(user_id: int, mbti: str, supabase: Client) -> dict:
     """
     사용자의 MBTI를 저장하거나 업데이트합니다.
+    먼저 mbti 컬럼만 update 하고, 바뀐 행이 없을 때(사용자가 없음)만 새로 생성합니다.
+    (upsert 는 insert 경로에서 name/password 같은 NOT NULL 컬럼이 비어 실패하므로 쓰지 않습니다)
     """
     try:
-        # 사용자가 존재하는지 확인
-        existing_user = supabase.table('users')\
-            .select('id, mbti')\
+        response = supabase.table('users')\
+            .update({'mbti': mbti})\
             .eq('id', user_id)\
             .execute()
-        
-        if existing_user.data and len(existing_user.data) > 0:
-            # 사용자가 존재하면 MBTI 업데이트
-            response = supabase.table('users')\
-                .update({'mbti': mbti})\
-                .eq('id', user_id)\
-                .execute()
-            
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-            else:
-                raise Exception("MBTI 업데이트에 실패했습니다.")
-        else:
+
+        if not response.data:
             # 사용자가 없으면 새로 생성
-            user_insert = {
-                'id': user_id,
-                'mbti': mbti
-            }
-            
             response = supabase.table('users')\
-                .insert(user_insert)\
+                .insert({'id': user_id, 'mbti': mbti})\
                 .execute()
-            
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-            else:
+
+            if not response.data:
                 raise Exception("사용자 생성에 실패했습니다.")
-            
+
+        user_profiles.set(user_id, {'mbti': response.data[0].get('mbti', mbti)})
+        return response.data[0]
+
     except Exception as e:
+        # 저장 성공 여부를 알 수 없으므로 캐시된 값을 버립니다.
+        user_profiles.delete(user_id)
         print(f"MBTI 저장 실패: {e}")
         raise e
 
@@ -50,15 +74,9 @@ def get_mbti_service(user_id: int, supabase: Client) -> Optional[str]:
     사용자의 MBTI를 조회합니다.
     """
     try:
-        response = supabase.table('users')\
-            .select('mbti')\
-            .eq('id', user_id)\
-            .execute()
-        
-        if response.data and len(response.data) > 0:
-            return response.data[0]['mbti']
-        return None
-        
+        profile = get_user_profile(user_id, supabase)
+        return profile['mbti'] if profile else None
+
     except Exception as e:
         print(f"MBTI 조회 실패 > user_id {user_id}: {e}")
-        return None
\ No newline at end of file
+        return None
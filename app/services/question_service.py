@@ -1,21 +1,26 @@
 from supabase import Client
 from app.schemas.schemas import QuestionItem
-from typing import Optional, List
+from app.core.pagination import KEYSET_COLUMNS, apply_keyset, decode_cursor, split_page
+from app.core.projection import columns_for
+from pydantic import BaseModel
+from typing import Optional, List, Tuple, Type
 from datetime import datetime
 
-def create_question_service(user_id: int, course_id: int, question_data: QuestionItem, supabase: Client) -> dict:
+def create_question_service(user_id: int, course_id: int, question_data: QuestionItem, supabase: Client, user_verified: bool = False) -> dict:
     """
     새로운 질문을 생성합니다.
+    user_verified=True 이면 (토큰으로 확인된 사용자) 사용자 존재 여부 조회를 생략합니다.
     """
     try:
         # 사용자가 존재하는지 확인
-        user = supabase.table('users')\
-            .select('id')\
-            .eq('id', user_id)\
-            .execute()
-        
-        if not user.data or len(user.data) == 0:
-            raise ValueError("존재하지 않는 사용자입니다.")
+        if not user_verified:
+            user = supabase.table('users')\
+                .select('id')\
+                .eq('id', user_id)\
+                .execute()
+            
+            if not user.data or len(user.data) == 0:
+                raise ValueError("존재하지 않는 사용자입니다.")
         
         # 코스가 존재하는지 확인
         course = supabase.table('courses')\
@@ -49,13 +54,15 @@ def create_question_service(user_id: int, course_id: int, question_data: Questio
         print(f"질문 생성 실패: {e}")
         raise e
 
-def get_question_service(course_id: int, supabase: Client) -> Optional[dict]:
+def get_question_service(course_id: int, supabase: Client, model: Optional[Type[BaseModel]] = None) -> Optional[dict]:
     """
     특정 코스의 가장 최근 질문을 조회합니다.
+    model이 주어지면 그 필드에 해당하는 컬럼만 조회합니다. (users 조인 없음)
     """
     try:
+        columns = columns_for(model) if model else '*, users(id, name)'
         response = supabase.table('questions')\
-            .select('*, users(id, name)')\
+            .select(columns)\
             .eq('courseId', course_id)\
             .order('created_at', desc=True)\
             .limit(1)\
@@ -69,22 +76,34 @@ def get_question_service(course_id: int, supabase: Client) -> Optional[dict]:
         print(f"질문 조회 실패: {e}")
         return None
 
-def get_question_list_service(course_id: int, supabase: Client) -> List[dict]:
+def get_question_page_service(course_id: int, supabase: Client, limit: Optional[int] = None,
+                              cursor: Optional[str] = None, model: Optional[Type[BaseModel]] = None) -> Tuple[List[dict], Optional[str]]:
     """
-    특정 코스의 모든 질문 목록을 조회합니다.
+    특정 코스의 질문을 최신순((created_at, id) 내림차순)으로 조회합니다. (질문 목록, next_cursor)
+    limit이 없으면 전체를 반환합니다. 잘못된 커서는 ValueError.
+    model이 주어지면 그 필드에 해당하는 컬럼만 조회합니다. (users 조인 없음)
     """
+    if cursor:
+        decode_cursor(cursor)
     try:
-        response = supabase.table('questions')\
-            .select('*, users(id, name)')\
-            .eq('courseId', course_id)\
-            .order('created_at', desc=True)\
-            .execute()
-        
-        return response.data if response.data else []
-            
+        columns = columns_for(model, KEYSET_COLUMNS) if model else '*, users(id, name)'
+        query = supabase.table('questions')\
+            .select(columns)\
+            .eq('courseId', course_id)
+        response = apply_keyset(query, cursor, limit).execute()
+
+        return split_page(response.data if response.data else [], limit)
+
     except Exception as e:
         print(f"질문 목록 조회 실패: {e}")
-        return []
+        return [], None
+
+def get_question_list_service(course_id: int, supabase: Client) -> List[dict]:
+    """
+    특정 코스의 모든 질문 목록을 조회합니다.
+    """
+    questions, _ = get_question_page_service(course_id, supabase)
+    return questions
     
 def answer_question_service(question_id: int, answer: str, supabase: Client, answerer_id: int) -> dict:
     """
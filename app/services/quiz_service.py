@@ -1,22 +1,135 @@
 # app/services/quiz_service.py
 from supabase import Client
 from app.schemas.schemas import *
-from typing import Optional
+from app.core.cache import SnapshotCache
+from app.core.config import settings
+from collections import OrderedDict
+from typing import Optional, Tuple, List
+import threading
 import traceback
 import random
 
+class QuizPool:
+    """
+    퀴즈 전체를 메모리에 보관하는 풀
+    quizzes[i] 와 payloads[i] 는 같은 퀴즈이며, payloads 는 미리 직렬화한 QuizResponse JSON 입니다.
+    """
+    __slots__ = ('quizzes', 'payloads')
+
+    def __init__(self, rows: list):
+        quizzes = []
+        payloads = []
+        for row in rows:
+            try:
+                payload = QuizResponse(
+                    id=row['id'], title=row['title'], content=row['content'], correct=row['correct']
+                ).model_dump_json().encode()
+            except Exception:
+                print(f"퀴즈 직렬화 실패, 건너뜀: {row.get('id')}")
+                continue
+            quizzes.append(row)
+            payloads.append(payload)
+        self.quizzes: Tuple[dict, ...] = tuple(quizzes)
+        self.payloads: Tuple[bytes, ...] = tuple(payloads)
+
+    def __len__(self) -> int:
+        return len(self.quizzes)
+
+def _load_quiz_pool(supabase: Client) -> QuizPool:
+    resp = supabase.table('quizes').select('*').execute()
+    return QuizPool(resp.data if getattr(resp, "data", None) else [])
+
+_quiz_pool = SnapshotCache('quiz_pool', _load_quiz_pool, settings.QUIZ_POOL_TTL_SECONDS)
+
+def invalidate_quiz_pool() -> None:
+    """
+    퀴즈가 추가/수정되었을 때 호출합니다. 다음 조회 시 풀을 새로 불러옵니다.
+    """
+    _quiz_pool.invalidate()
+
+def quiz_pool_stats() -> dict:
+    return _quiz_pool.stats()
+
+def _random_index(pool: QuizPool) -> Optional[int]:
+    if not len(pool):
+        return None
+    return random.randrange(len(pool))
+
 def get_random_quiz_service(supabase: Client) -> Optional[dict]:
     try:
-        resp = supabase.table('quizes').select('*').execute()
-        if getattr(resp, "error", None):
-            return None
+        pool = _quiz_pool.get(supabase).value
+        index = _random_index(pool)
+        return pool.quizzes[index] if index is not None else None
+    except Exception:
+        traceback.print_exc()
+        return None
 
-        rows = resp.data if getattr(resp, "data", None) else []
-        if not rows:
-            return None
+def get_random_quiz_payload_service(supabase: Client) -> Optional[bytes]:
+    """
+    미리 직렬화해 둔 QuizResponse JSON 을 무작위로 하나 반환합니다. (요청마다 DB 조회/직렬화 없음)
+    """
+    try:
+        pool = _quiz_pool.get(supabase).value
+        index = _random_index(pool)
+        return pool.payloads[index] if index is not None else None
+    except Exception:
+        traceback.print_exc()
+        return None
+
+class SeenQuizStore:
+    """
+    세션별로 이미 본 퀴즈를 풀 인덱스 비트셋(int)으로 기억합니다.
+    세션 수는 max_sessions 로 제한하며 가장 오래 쓰지 않은 세션부터 버립니다.
+    풀 버전이 바뀌면 인덱스가 달라지므로 해당 세션의 기록을 초기화합니다.
+    """
+
+    def __init__(self, max_sessions: int):
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, Tuple[int, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def pick(self, session_id: str, version: int, size: int, n: int) -> List[int]:
+        """
+        아직 보지 않은 퀴즈 인덱스를 최대 n개 고르고 본 것으로 표시합니다.
+        남은 퀴즈가 n개보다 적으면 남은 것을 모두 주고 새 바퀴를 시작합니다.
+        """
+        with self._lock:
+            seen_version, bits = self._sessions.pop(session_id, (version, 0))
+            if seen_version != version:
+                bits = 0
 
-        quiz = random.choice(rows)
-        return quiz
+            unseen = [i for i in range(size) if not (bits >> i) & 1]
+            chosen = random.sample(unseen, min(n, len(unseen)))
+            marked = chosen
+            if len(chosen) < n:
+                # 한 바퀴를 다 봤으므로 초기화하고 이번 묶음에 없는 퀴즈로 채웁니다.
+                # 새 바퀴에서 본 것으로 표시하는 것은 채운 퀴즈뿐입니다. (지난 바퀴의 나머지는 새 바퀴에서 다시 나올 수 있음)
+                bits = 0
+                picked = set(chosen)
+                rest = [i for i in range(size) if i not in picked]
+                marked = random.sample(rest, min(n - len(chosen), len(rest)))
+                chosen = chosen + marked
+
+            for i in marked:
+                bits |= 1 << i
+            self._sessions[session_id] = (version, bits)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+            return chosen
+
+_seen_quizzes = SeenQuizStore(settings.QUIZ_SESSION_MAX)
+
+def get_quiz_batch_payload_service(session_id: str, n: int, supabase: Client) -> Optional[bytes]:
+    """
+    세션이 아직 보지 않은 서로 다른 퀴즈 n개를 QuizBatchResponse JSON 으로 반환합니다.
+    """
+    try:
+        snap = _quiz_pool.get(supabase)
+        pool = snap.value
+        if not len(pool):
+            return None
+        indices = _seen_quizzes.pick(session_id, snap.version, len(pool), n)
+        return b'{"quizzes":[' + b','.join(pool.payloads[i] for i in indices) + b']}'
     except Exception:
         traceback.print_exc()
-        return None
\ No newline at end of file
+        return None
@@ -0,0 +1,37 @@
+# app/services/review_summary_service.py
+"""
+코스별 리뷰 요약(개수, 평점 합계/분포, 키워드 빈도) 조회 서비스
+집계는 reviews 트리거가 course_review_stats 테이블에 증분으로 유지하므로 reviews 를 읽지 않습니다.
+"""
+from supabase import Client
+
+
+def _summary_from_row(course_id: int, row: dict) -> dict:
+    count = int(row.get('count') or 0)
+    rating_sum = int(row.get('rating_sum') or 0)
+    return {
+        'courseId': course_id,
+        'count': count,
+        'average': round(rating_sum / count, 2) if count else None,
+        'histogram': {int(rating): int(n) for rating, n in (row.get('histogram') or {}).items()},
+        'keywords': {k: int(n) for k, n in (row.get('keywords') or {}).items()},
+    }
+
+
+def get_review_summary_service(course_id: int, supabase: Client) -> dict:
+    """
+    코스의 리뷰 개수, 평균 평점, 평점 분포, 키워드 빈도를 반환합니다.
+    (course_review_stats 의 한 행, 리뷰가 없으면 빈 요약)
+    """
+    try:
+        response = supabase.table('course_review_stats')\
+            .select('count, rating_sum, histogram, keywords')\
+            .eq('course_id', course_id)\
+            .limit(1)\
+            .execute()
+        
+        row = response.data[0] if response.data else {}
+        return _summary_from_row(course_id, row)
+    except Exception as e:
+        print(f"후기 요약 조회 실패 (course_id={course_id}): {e}")
+        raise e
@@ -1,7 +1,15 @@
 from supabase import Client
 import requests
-from datetime import datetime
-from typing import Optional
+from operator import ge, gt, lt
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from app.core.cache import AsyncSingleFlight, LRUCache, MISSING
+from app.core.config import settings
+from app.core.executor import run_db
+from app.core.regions import region_locations
+from app.core.scheduler import PeriodicTask
 
 def get_sea_data(location: str, api_key: str) -> dict:
     """
@@ -25,150 +33,125 @@ def get_sea_data(location: str, api_key: str) -> dict:
             "watertemperature": 18.74
         }
 
-def analyze_sea_emotion(sea_data: dict) -> dict:
-    """
-    해양 데이터를 분석하여 바다의 성격 판단
-    """
-    waves = sea_data.get("wavesHeight", 1.0)
-    wind = sea_data.get("windSpeed", 8.0)
-    temperature = sea_data.get("watertemperature", 18.0)
-    
-    # 바다 상태에 따른 감정 분류
-     # 1. 잠든 바다
-    if waves < 0.3 and wind < 3:
-        return {
-            "emotion": "😴",
-            "name": "잠든 바다",
-            "message": "거울처럼 고요해요. 명상하기 완벽한 날이에요"
-        }
-    
+# 바다 성격 분류 결과
+_SLEEPING = {"emotion": "😴", "name": "잠든 바다", "message": "거울처럼 고요해요. 명상하기 완벽한 날이에요"}
+_PARADISE = {"emotion": "🏖️", "name": "천국 같은 바다", "message": "물놀이 최적의 조건이에요! 수영 Go Go!"}
+_CALM = {"emotion": "🫧", "name": "평온한 바다", "message": "산책하기 좋은 날이에요"}
+_REFRESHING = {"emotion": "☀️", "name": "상쾌한 바다", "message": "수영하기 딱 좋은 날씨예요"}
+_SUNNY = {"emotion": "🔅", "name": "화창한 바다", "message": "해양 스포츠 즐기기 좋은 날이에요"}
+_SURFER = {"emotion": "🏄", "name": "서퍼의 바다", "message": "파도타기 최고의 컨디션이에요!"}
+_LIVELY = {"emotion": "🌊", "name": "활기찬 바다", "message": "파도가 살아있어요. 물놀이 조심하세요"}
+_WINDY = {"emotion": "💨", "name": "바람부는 바다", "message": "연날리기 좋은 날이에요. 모자 단단히 잡으세요!"}
+_EXCITED = {"emotion": "🌀", "name": "들뜬 바다", "message": "바람이 제법 불어요. 주의하며 즐기세요"}
+_COLD = {"emotion": "❄️", "name": "차가운 바다", "message": "겨울 바다의 고요함. 따뜻하게 입고 산책하세요"}
+_AGITATED = {"emotion": "〰️", "name": "흥분한 바다", "message": "파도가 높아요. 해변가에서만 활동하세요"}
+_ROUGH = {"emotion": "💪", "name": "거친 바다", "message": "안전에 주의하세요. 입수는 위험해요"}
+_HARSH = {"emotion": "⚠️", "name": "험한 바다", "message": "물놀이 금지! 해변 산책 정도만 권장해요"}
+_ANGRY = {"emotion": "⛈️", "name": "성난 바다", "message": "입수 금지! 해변에서도 안전거리를 유지하세요"}
+_FURIOUS = {"emotion": "🌊⚡", "name": "광폭한 바다", "message": "매우 위험해요. 해안가 접근을 자제하세요"}
+
+# 바다 성격 결정표
+# 위에서부터 차례로 보며, 모든 조건 (측정값, 비교, 기준값) 을 만족하는 첫 행의 결과를 씁니다.
+# 비교 함수는 숫자와 NumPy 배열 모두에 동작하므로 한 건 분류와 배열 일괄 분류가 같은 표를 씁니다.
+# (NaN 은 모든 비교가 거짓이므로 두 경로에서 똑같이 다음 행으로 넘어갑니다.)
+SEA_EMOTION_RULES = (
+    # 1. 잠든 바다
+    ((("waves", lt, 0.3), ("wind", lt, 3)), _SLEEPING),
     # 2. 천국 같은 바다
-    if temperature > 25 and waves < 0.5 and wind < 5:
-        return {
-            "emotion": "🏖️",
-            "name": "천국 같은 바다",
-            "message": "물놀이 최적의 조건이에요! 수영 Go Go!"
-        }
-    
+    ((("temperature", gt, 25), ("waves", lt, 0.5), ("wind", lt, 5)), _PARADISE),
     # 3. 평온한 바다
-    if waves < 0.5 and wind < 5 and temperature > 20:
-        return {
-            "emotion": "🫧",
-            "name": "평온한 바다",
-            "message": "산책하기 좋은 날이에요"
-        }
-    
+    ((("waves", lt, 0.5), ("wind", lt, 5), ("temperature", gt, 20)), _CALM),
     # 4. 상쾌한 바다
-    if waves < 0.8 and wind < 7 and temperature > 18:
-        return {
-            "emotion": "☀️",
-            "name": "상쾌한 바다",
-            "message": "수영하기 딱 좋은 날씨예요"
-        }
-    
+    ((("waves", lt, 0.8), ("wind", lt, 7), ("temperature", gt, 18)), _REFRESHING),
     # 5. 화창한 바다
-    if waves < 1.0 and wind < 8 and temperature > 17:
-        return {
-            "emotion": "🔅",
-            "name": "화창한 바다",
-            "message": "해양 스포츠 즐기기 좋은 날이에요"
-        }
-    
+    ((("waves", lt, 1.0), ("wind", lt, 8), ("temperature", gt, 17)), _SUNNY),
     # 6. 서퍼의 바다
-    if waves >= 1.2 and waves < 2.0 and wind < 10:
-        return {
-            "emotion": "🏄",
-            "name": "서퍼의 바다",
-            "message": "파도타기 최고의 컨디션이에요!"
-        }
-    
+    ((("waves", ge, 1.2), ("waves", lt, 2.0), ("wind", lt, 10)), _SURFER),
     # 7. 활기찬 바다
-    if waves < 1.5 and wind < 10:
-        return {
-            "emotion": "🌊",
-            "name": "활기찬 바다",
-            "message": "파도가 살아있어요. 물놀이 조심하세요"
-        }
-    
+    ((("waves", lt, 1.5), ("wind", lt, 10)), _LIVELY),
     # 8. 바람부는 바다
-    if wind >= 12 and wind < 15 and waves < 1.5:
-        return {
-            "emotion": "💨",
-            "name": "바람부는 바다",
-            "message": "연날리기 좋은 날이에요. 모자 단단히 잡으세요!"
-        }
-    
+    ((("wind", ge, 12), ("wind", lt, 15), ("waves", lt, 1.5)), _WINDY),
     # 9. 들뜬 바다
-    if waves < 2.0 and wind < 12:
-        return {
-            "emotion": "🌀",
-            "name": "들뜬 바다",
-            "message": "바람이 제법 불어요. 주의하며 즐기세요"
-        }
-    
+    ((("waves", lt, 2.0), ("wind", lt, 12)), _EXCITED),
     # 10. 차가운 바다
-    if temperature < 15 and waves < 1.5:
-        return {
-            "emotion": "❄️",
-            "name": "차가운 바다",
-            "message": "겨울 바다의 고요함. 따뜻하게 입고 산책하세요"
-        }
-    
+    ((("temperature", lt, 15), ("waves", lt, 1.5)), _COLD),
     # 11. 흥분한 바다
-    if waves < 2.5 and wind < 15:
-        return {
-            "emotion": "〰️",
-            "name": "흥분한 바다",
-            "message": "파도가 높아요. 해변가에서만 활동하세요"
-        }
-    
+    ((("waves", lt, 2.5), ("wind", lt, 15)), _AGITATED),
     # 12. 거친 바다
-    if waves < 3.0 and wind < 18:
-        return {
-            "emotion": "💪",
-            "name": "거친 바다",
-            "message": "안전에 주의하세요. 입수는 위험해요"
-        }
-    
+    ((("waves", lt, 3.0), ("wind", lt, 18)), _ROUGH),
     # 13. 험한 바다
-    if waves < 3.5 and wind < 20:
-        return {
-            "emotion": "⚠️",
-            "name": "험한 바다",
-            "message": "물놀이 금지! 해변 산책 정도만 권장해요"
-        }
-    
-    # 14. 성난 바다
-    if waves < 4.0 or wind < 25:
-        return {
-            "emotion": "⛈️",
-            "name": "성난 바다",
-            "message": "입수 금지! 해변에서도 안전거리를 유지하세요"
-        }
-    
-    # 15. 광폭한 바다 (그 외 모든 경우)
-    return {
-        "emotion": "🌊⚡",
-        "name": "광폭한 바다",
-        "message": "매우 위험해요. 해안가 접근을 자제하세요"
+    ((("waves", lt, 3.5), ("wind", lt, 20)), _HARSH),
+    # 14. 성난 바다 (파도 4.0 미만 또는 바람 25 미만 -> 두 행으로 나눔)
+    ((("waves", lt, 4.0),), _ANGRY),
+    ((("wind", lt, 25),), _ANGRY),
+)
+# 15. 광폭한 바다 (그 외 모든 경우)
+SEA_EMOTION_DEFAULT = _FURIOUS
+
+
+def _matches(conditions, readings: dict):
+    return all(op(readings[field], threshold) for field, op, threshold in conditions)
+
+
+def analyze_sea_emotion(sea_data: dict) -> dict:
+    """
+    해양 데이터를 분석하여 바다의 성격 판단
+    """
+    readings = {
+        "waves": sea_data.get("wavesHeight", 1.0),
+        "wind": sea_data.get("windSpeed", 8.0),
+        "temperature": sea_data.get("watertemperature", 18.0),
     }
+    
+    # 바다 상태에 따른 감정 분류
+    for conditions, result in SEA_EMOTION_RULES:
+        if _matches(conditions, readings):
+            return dict(result)
+    return dict(SEA_EMOTION_DEFAULT)
+
+
+def classify_sea_emotions(waves, wind, temperature):
+    """
+    측정값 배열을 한 번에 분류해 결정표 행 번호 배열을 반환합니다.
+    어떤 행에도 맞지 않으면 len(SEA_EMOTION_RULES) (광폭한 바다)
+    """
+    import numpy as np
+
+    waves, wind, temperature = np.broadcast_arrays(
+        np.asarray(waves, dtype=float),
+        np.asarray(wind, dtype=float),
+        np.asarray(temperature, dtype=float),
+    )
+    readings = {"waves": waves, "wind": wind, "temperature": temperature}
+    conditions = [
+        np.logical_and.reduce([op(readings[field], threshold) for field, op, threshold in rule])
+        for rule, _ in SEA_EMOTION_RULES
+    ]
+    return np.select(conditions, np.arange(len(SEA_EMOTION_RULES)), default=len(SEA_EMOTION_RULES))
+
+
+def analyze_sea_emotions(waves, wind, temperature) -> List[dict]:
+    """
+    여러 관측소/예보 시점의 측정값 배열을 한 번에 분석합니다.
+    (결과는 analyze_sea_emotion 을 한 건씩 호출한 것과 같습니다.)
+    """
+    results = [result for _, result in SEA_EMOTION_RULES] + [SEA_EMOTION_DEFAULT]
+    return [dict(results[i]) for i in classify_sea_emotions(waves, wind, temperature).ravel()]
 
 
-def get_cached_emotion(location: str, supabase: Client) -> Optional[dict]:
+def get_cached_emotion(location: str, supabase: Client, bucket: Optional[datetime] = None) -> Optional[dict]:
     """
     데이터베이스에서 캐시된 바다 성격 정보를 조회합니다.
-    (10분 이내 캐시된 데이터 반환)
+    ((location, bucket) 행 하나, 기본값은 현재 시각이 속한 구간)
     """
     try:
-        # 10분 전 시간 계산
-        ten_minutes_ago = datetime.now().replace(second=0, microsecond=0)
-        ten_minutes_ago = ten_minutes_ago.replace(minute=(ten_minutes_ago.minute // 10) * 10)
+        if bucket is None:
+            bucket = sea_emotion_cache.bucket(location)[0]
         
         response = supabase.table('sea_emotions')\
             .select('emotion, name, message')\
             .eq('location', location)\
-            .gte('cached_at', ten_minutes_ago.isoformat())\
-            .order('cached_at', desc=True)\
+            .eq('bucket', bucket.isoformat())\
             .limit(1)\
             .execute()
         
@@ -180,13 +163,18 @@ def get_cached_emotion(location: str, supabase: Client) -> Optional[dict]:
         print(f"캐시 조회 실패: {e}")
         return None
 
-def save_emotion_cache(location: str, emotion_data: dict, sea_data: dict, supabase: Client) -> bool:
+def save_emotion_cache(location: str, emotion_data: dict, sea_data: dict, supabase: Client, bucket: Optional[datetime] = None) -> bool:
     """
     바다 성격 정보를 데이터베이스에 캐시합니다.
+    (location, bucket) 당 한 행만 유지하도록 upsert 합니다. bucket 기본값은 현재 시각이 속한 구간
     """
     try:
-        cache_insert = {
+        if bucket is None:
+            bucket = sea_emotion_cache.bucket(location)[0]
+        
+        cache_upsert = {
             'location': location,
+            'bucket': bucket.isoformat(),
             'emotion': emotion_data['emotion'],
             'name': emotion_data['name'],
             'message': emotion_data['message'],
@@ -195,7 +183,7 @@ def save_emotion_cache(location: str, emotion_data: dict, sea_data: dict, supaba
         }
         
         response = supabase.table('sea_emotions')\
-            .insert(cache_insert)\
+            .upsert(cache_upsert, on_conflict='location,bucket')\
             .execute()
         
         return response.data is not None and len(response.data) > 0
@@ -204,49 +192,237 @@ def save_emotion_cache(location: str, emotion_data: dict, sea_data: dict, supaba
         print(f"캐시 저장 실패: {e}")
         return False
 
-def get_sea_emotion_service(location: str, api_key: str, supabase: Client) -> dict:
+
+def _parse_ttl_overrides(raw: str) -> Dict[str, int]:
+    """
+    "해운대=300,광안리=900" 형식의 지역별 캐시 시간을 읽습니다.
+    """
+    overrides = {}
+    for item in (raw or '').split(','):
+        location, sep, seconds = item.partition('=')
+        if not sep:
+            continue
+        try:
+            overrides[location.strip()] = int(seconds)
+        except ValueError:
+            print(f"바다 성격 캐시 설정 무시: {item}")
+    return overrides
+
+
+class SeaEmotionCache:
+    """
+    바다 성격 2단 캐시 (프로세스 메모리 LRU -> sea_emotions 테이블)
+
+    지역마다 캐시 시간(ttl)을 길이로 하는 시간 구간(버킷)을 나누고 (지역, 버킷 시작 시각)을 키로 씁니다.
+    메모리 항목은 버킷이 끝나는 순간 만료되고, DB는 (location, bucket) 행으로 찾으므로 두 계층이 함께 만료됩니다.
+    """
+
+    def __init__(self, max_size: int, default_ttl: int, ttl_overrides: Dict[str, int]):
+        self.default_ttl = default_ttl
+        self.ttl_overrides = ttl_overrides
+        self._memory = LRUCache('sea_emotion', max_size)
+        self._lock = threading.Lock()
+        self.db_hits = 0
+        self.db_misses = 0
+
+    def ttl_for(self, location: str) -> int:
+        return self.ttl_overrides.get(location, self.default_ttl)
+
+    def bucket(self, location: str, now: Optional[float] = None) -> Tuple[datetime, float]:
+        """
+        현재 시각이 속한 버킷의 (시작 시각, 끝나는 epoch 초) 를 반환합니다.
+        """
+        ttl = self.ttl_for(location)
+        now = time.time() if now is None else now
+        start = now - now % ttl
+        return datetime.fromtimestamp(start), start + ttl
+
+    def get(self, location: str, supabase: Client) -> Optional[dict]:
+        bucket_start, bucket_end = self.bucket(location)
+        key = (location, bucket_start)
+
+        cached = self._memory.get(key)
+        if cached is not MISSING:
+            return dict(cached)
+
+        cached = get_cached_emotion(location, supabase, bucket=bucket_start)
+        with self._lock:
+            if cached:
+                self.db_hits += 1
+            else:
+                self.db_misses += 1
+        if cached:
+            self._memory.set(key, cached, ttl_seconds=bucket_end - time.time())
+        return cached
+
+    def peek(self, location: str) -> Optional[dict]:
+        """
+        메모리 계층만 확인합니다. (DB를 조회하지 않고 적중/미적중도 세지 않음)
+        """
+        bucket_start, _ = self.bucket(location)
+        cached = self._memory.peek((location, bucket_start))
+        return None if cached is MISSING else dict(cached)
+
+    def put(self, location: str, emotion_data: dict, sea_data: dict, supabase: Client, at: Optional[float] = None) -> None:
+        """
+        결과를 두 계층에 저장합니다.
+        at(epoch 초)을 주면 그 시각이 속한 버킷에 저장합니다. (다음 버킷 예열)
+        """
+        bucket_start, bucket_end = self.bucket(location, at)
+        save_emotion_cache(location, emotion_data, sea_data, supabase, bucket=bucket_start)
+        value = {k: emotion_data[k] for k in ('emotion', 'name', 'message')}
+        self._memory.set((location, bucket_start), value, ttl_seconds=bucket_end - time.time())
+
+    def stats(self) -> dict:
+        db_lookups = self.db_hits + self.db_misses
+        memory = self._memory.stats()
+        total = memory['hits'] + memory['misses']
+        return {
+            'memory': memory,
+            'db': {
+                'hits': self.db_hits,
+                'misses': self.db_misses,
+                'hit_rate': round(self.db_hits / db_lookups, 3) if db_lookups else None,
+            },
+            'hit_rate': round((memory['hits'] + self.db_hits) / total, 3) if total else None,
+            'default_ttl_seconds': self.default_ttl,
+            'ttl_overrides': dict(self.ttl_overrides),
+        }
+
+
+sea_emotion_cache = SeaEmotionCache(
+    settings.SEA_EMOTION_CACHE_SIZE,
+    settings.SEA_EMOTION_TTL_SECONDS,
+    _parse_ttl_overrides(settings.SEA_EMOTION_TTL_OVERRIDES),
+)
+
+
+# 지역별로 외부 API 호출과 캐시 저장이 한 번만 일어나도록 동시 미스를 합칩니다.
+# (이벤트 루프에서 합치므로 leader 한 건만 DB 풀 스레드를 씁니다)
+sea_emotion_flight = AsyncSingleFlight('sea_emotion')
+
+
+def sea_emotion_cache_stats() -> dict:
+    stats = sea_emotion_cache.stats()
+    stats['single_flight'] = sea_emotion_flight.stats()
+    return stats
+
+
+def _refresh_sea_emotion(location: str, api_key: str, supabase: Client) -> dict:
+    """
+    외부 API로 해양 데이터를 받아 분석하고 캐시에 저장합니다.
+    """
+    # 앞선 leader가 방금 저장했을 수 있으므로 메모리 계층만 한 번 더 확인합니다.
+    # (leader는 저장과 동시에 메모리에도 넣으므로 DB를 다시 읽을 필요가 없습니다.)
+    cached = sea_emotion_cache.peek(location)
+    if cached:
+        return cached
+
+    sea_data = get_sea_data(location, api_key)
+    emotion_result = analyze_sea_emotion(sea_data)
+    sea_emotion_cache.put(location, emotion_result, sea_data, supabase)
+    return emotion_result
+
+
+def prewarm_sea_emotion(location: str, api_key: str, supabase: Client, at: float) -> dict:
+    """
+    at(epoch 초)이 속한 버킷의 바다 성격을 미리 계산해 캐시에 넣습니다.
+    """
+    sea_data = get_sea_data(location, api_key)
+    emotion_result = analyze_sea_emotion(sea_data)
+    sea_emotion_cache.put(location, emotion_result, sea_data, supabase, at=at)
+    return emotion_result
+
+
+def known_sea_locations(supabase: Client) -> List[str]:
+    """
+    예열 대상 지역 목록 (region_info 지역명 + 지역 레지스트리의 지역/명소 이름)
+    """
+    locations = []
+    try:
+        response = supabase.table('region_info')\
+            .select('region_name')\
+            .execute()
+        locations.extend(row['region_name'] for row in response.data or [] if row.get('region_name'))
+    except Exception as e:
+        print(f"예열 지역 조회 실패: {e}")
+    locations.extend(region_locations())
+    return list(dict.fromkeys(locations))
+
+
+async def get_sea_emotion_service(location: str, api_key: str, supabase: Client) -> dict:
     """
     바다 성격 정보를 조회하거나 생성합니다.
-    1. 캐시 확인 (10분 이내)
+    1. 캐시 확인 (메모리 -> DB, 지역별 캐시 시간 이내)
     2. 캐시 없으면 외부 API 호출 및 분석
     3. 결과 캐싱
+    2~3은 지역별 single-flight 로 실행되어 동시에 미스가 나도 한 번만 일어납니다.
+    동기 호출은 모두 DB 풀(run_db)에서 실행하고, leader를 기다리는 요청은 이벤트 루프에서 대기합니다.
     """
     try:
         # 1. 캐시 확인
-        cached = get_cached_emotion(location, supabase)
+        cached = await run_db(sea_emotion_cache.get, location, supabase)
         if cached:
             return cached
         
-        # 2. 외부 API에서 해양 데이터 조회
-        sea_data = get_sea_data(location, api_key)
-        
-        # 3. 해양 데이터 분석하여 바다 성격 판단
-        emotion_result = analyze_sea_emotion(sea_data)
-        
-        # 4. 캐시 저장
-        save_emotion_cache(location, emotion_result, sea_data, supabase)
-        
-        return emotion_result
+        # 2~3. 외부 API 조회, 분석, 캐시 저장 (같은 지역의 동시 요청은 결과를 함께 받음)
+        emotion_result = await sea_emotion_flight.do(
+            location, lambda: run_db(_refresh_sea_emotion, location, api_key, supabase)
+        )
+        return dict(emotion_result)
             
     except Exception as e:
         print(f"바다 성격 조회 실패: {e}")
         raise e
 
-def clean_old_cache(supabase: Client, days: int = 7) -> bool:
+def clean_old_cache(supabase: Client, days: int = 7, batch_size: int = 500, max_batches: int = 20) -> int:
     """
-    오래된 캐시 데이터를 삭제합니다. (선택사항)
+    보존 기간(days)이 지난 캐시 행을 batch_size 개씩 나눠 삭제합니다.
+    한 번 실행에 최대 max_batches 번까지만 지우고, 남은 행은 다음 실행에서 지웁니다.
+    삭제한 행 수를 반환합니다.
     """
+    cutoff_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=days)
+    deleted = 0
     try:
-        cutoff_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        cutoff_date = cutoff_date.replace(day=cutoff_date.day - days)
-        
-        response = supabase.table('sea_emotions')\
-            .delete()\
-            .lt('cached_at', cutoff_date.isoformat())\
-            .execute()
-        
-        return True
+        for _ in range(max_batches):
+            response = supabase.table('sea_emotions')\
+                .select('id')\
+                .lt('cached_at', cutoff_date.isoformat())\
+                .order('id')\
+                .limit(batch_size)\
+                .execute()
+            
+            ids = [row['id'] for row in response.data or []]
+            if not ids:
+                break
+            
+            supabase.table('sea_emotions')\
+                .delete()\
+                .in_('id', ids)\
+                .execute()
+            deleted += len(ids)
+            
+            if len(ids) < batch_size:
+                break
+        return deleted
             
     except Exception as e:
         print(f"캐시 정리 실패: {e}")
-        return False
\ No newline at end of file
+        return deleted
+
+
+def run_sea_emotion_retention(supabase: Client) -> int:
+    """
+    설정된 보존 기간/배치 크기로 clean_old_cache 를 실행합니다.
+    """
+    return clean_old_cache(
+        supabase,
+        days=settings.SEA_EMOTION_RETENTION_DAYS,
+        batch_size=settings.SEA_EMOTION_RETENTION_BATCH_SIZE,
+        max_batches=settings.SEA_EMOTION_RETENTION_MAX_BATCHES,
+    )
+
+
+sea_emotion_retention = PeriodicTask(
+    'sea-emotion-retention', settings.SEA_EMOTION_RETENTION_INTERVAL_SECONDS, run_sea_emotion_retention
+)
@@ -0,0 +1,114 @@
+# app/services/seamotion_warmer.py
+"""
+바다 성격 캐시 예열 작업
+알려진 모든 지역에 대해 현재 버킷이 끝나기 직전에 다음 버킷을 미리 계산해 두어,
+버킷이 바뀐 직후의 요청도 외부 API를 기다리지 않게 합니다.
+"""
+import asyncio
+import random
+import time
+from typing import Dict, List, Optional
+
+from supabase import Client
+from app.core.config import settings
+from app.core.executor import run_db
+from app.services.seamotion_service import known_sea_locations, prewarm_sea_emotion, sea_emotion_cache
+
+
+class SeaEmotionWarmer:
+    """
+    FastAPI lifespan 에서 start()/stop() 하는 asyncio 백그라운드 작업
+
+    - tick_seconds 마다 지역별 버킷 남은 시간을 확인하고, lead_seconds 이하로 남으면 다음 버킷을 예열합니다.
+    - 지역들이 한꺼번에 외부 API를 호출하지 않도록 0~jitter_seconds 사이로 흩어 실행합니다.
+    - 동시에 진행하는 예열은 concurrency 개로 제한합니다.
+    """
+
+    def __init__(self, lead_seconds: int, jitter_seconds: int, concurrency: int,
+                 tick_seconds: int, locations_ttl_seconds: int):
+        self.lead_seconds = lead_seconds
+        self.jitter_seconds = jitter_seconds
+        self.concurrency = concurrency
+        self.tick_seconds = tick_seconds
+        self.locations_ttl_seconds = locations_ttl_seconds
+
+        self._task: Optional[asyncio.Task] = None
+        self._pending: set = set()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._locations: List[str] = []
+        self._locations_loaded_at = 0.0
+        self._scheduled: Dict[str, float] = {}  # 지역 -> 예열을 예약한 다음 버킷의 시작(epoch 초)
+
+        self.warmed = 0
+        self.errors = 0
+
+    def start(self, supabase: Client) -> None:
+        if self._task is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._task = asyncio.create_task(self._run(supabase), name='sea-emotion-warmer')
+
+    async def stop(self) -> None:
+        tasks = [t for t in [self._task, *self._pending] if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._pending.clear()
+
+    async def _run(self, supabase: Client) -> None:
+        while True:
+            try:
+                await self._tick(supabase)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                print(f"바다 성격 예열 실패: {e}")
+            await asyncio.sleep(self.tick_seconds)
+
+    async def _tick(self, supabase: Client) -> None:
+        now = time.time()
+        if not self._locations or now - self._locations_loaded_at >= self.locations_ttl_seconds:
+            self._locations = await run_db(known_sea_locations, supabase)
+            self._locations_loaded_at = now
+
+        for location in self._locations:
+            _, bucket_end = sea_emotion_cache.bucket(location, now)
+            remaining = bucket_end - now
+            if remaining > self.lead_seconds or self._scheduled.get(location) == bucket_end:
+                continue
+            self._scheduled[location] = bucket_end
+            delay = random.uniform(0, max(0.0, min(self.jitter_seconds, remaining / 2)))
+            task = asyncio.create_task(self._warm(location, bucket_end, delay, supabase))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def _warm(self, location: str, next_bucket_start: float, delay: float, supabase: Client) -> None:
+        await asyncio.sleep(delay)
+        async with self._semaphore:
+            try:
+                await run_db(prewarm_sea_emotion, location, settings.SEA_API_KEY, supabase, next_bucket_start)
+                self.warmed += 1
+            except Exception as e:
+                self.errors += 1
+                # 다음 점검 때 다시 시도합니다.
+                self._scheduled.pop(location, None)
+                print(f"바다 성격 예열 실패 > {location}: {e}")
+
+    def stats(self) -> dict:
+        return {
+            'running': self._task is not None and not self._task.done(),
+            'locations': len(self._locations),
+            'pending': len(self._pending),
+            'warmed': self.warmed,
+            'errors': self.errors,
+        }
+
+
+sea_emotion_warmer = SeaEmotionWarmer(
+    settings.SEA_EMOTION_PREWARM_LEAD_SECONDS,
+    settings.SEA_EMOTION_PREWARM_JITTER_SECONDS,
+    settings.SEA_EMOTION_PREWARM_CONCURRENCY,
+    settings.SEA_EMOTION_PREWARM_TICK_SECONDS,
+    settings.SEA_EMOTION_LOCATIONS_TTL_SECONDS,
+)
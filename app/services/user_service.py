@@ -1,17 +1,59 @@
 # app/services/user_service.py
+"""
+회원가입/로그인 서비스
+비밀번호 해시와 검증은 CPU를 오래 쓰므로 호출하는 쪽에서 전용 풀(run_hash)로 실행하고,
+DB 조회/갱신(get_user_credentials, update_password_hash)은 DB 풀(run_db)로 실행합니다.
+"""
 from supabase import Client
-from typing import Optional
-import hashlib
+from functools import lru_cache
+from typing import Optional, Tuple
+from passlib.context import CryptContext
+from app.core.config import settings
+
+# 새 비밀번호는 bcrypt 로 저장하고, 예전 sha256 hex 해시도 검증할 수 있게 둡니다.
+# 예전 해시로 로그인에 성공하면 bcrypt 로 다시 해시해 저장합니다.
+pwd_context = CryptContext(
+    schemes=['bcrypt', 'hex_sha256'],
+    deprecated=['hex_sha256'],
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
 
 def hash_password(password: str) -> str:
     """
     비밀번호를 해시화합니다.
     """
-    return hashlib.sha256(password.encode()).hexdigest()
+    return pwd_context.hash(password)
 
-def signup_service(name: str, password: str, supabase: Client) -> dict:
+@lru_cache(maxsize=1)
+def _dummy_hash() -> str:
+    """
+    없는 사용자에 대해서도 같은 비용으로 검증하기 위한 bcrypt 해시 (처음 필요할 때 한 번 만듭니다.)
     """
-    회원가입을 처리합니다.
+    return pwd_context.hash('dummy-password')
+
+def verify_password(password: str, hashed_password: Optional[str]) -> Tuple[bool, Optional[str]]:
+    """
+    비밀번호를 검증합니다.
+    (일치 여부, 다시 저장해야 할 새 해시 또는 None) 을 반환합니다.
+    저장된 해시가 bcrypt 가 아니면 (없는 사용자, 예전 sha256 해시 등) 응답 시간으로 구분되지 않도록
+    더미 해시로 같은 비용의 bcrypt 검증을 한 번 더 합니다.
+    """
+    scheme = None
+    verified, new_hash = False, None
+    if hashed_password:
+        try:
+            scheme = pwd_context.identify(hashed_password)
+            verified, new_hash = pwd_context.verify_and_update(password, hashed_password)
+        except ValueError:
+            # 알 수 없는 형식의 해시
+            verified, new_hash = False, None
+    if scheme != 'bcrypt':
+        pwd_context.verify(password, _dummy_hash())
+    return verified, new_hash
+
+def signup_service(name: str, hashed_password: str, supabase: Client) -> dict:
+    """
+    회원가입을 처리합니다. (hashed_password 는 hash_password 결과)
     """
     try:
         # 이름 중복 확인 (선택사항)
@@ -23,9 +65,6 @@ def signup_service(name: str, password: str, supabase: Client) -> dict:
         if existing_user.data and len(existing_user.data) > 0:
             raise ValueError("이미 존재하는 이름입니다.")
         
-        # 비밀번호 해시화
-        hashed_password = hash_password(password)
-        
         # 사용자 생성
         user_insert = {
             'name': name,
@@ -45,23 +84,29 @@ def signup_service(name: str, password: str, supabase: Client) -> dict:
         print(f"회원가입 실패: {e}")
         raise e
 
-def verify_user(name: str, password: str, supabase: Client) -> Optional[dict]:
+def get_user_credentials(name: str, supabase: Client) -> Optional[dict]:
     """
-    로그인 시 사용자 인증을 처리합니다.
+    로그인 검증에 필요한 사용자 정보(저장된 비밀번호 해시 포함)를 이름으로 조회합니다.
+    """
+    response = supabase.table('users')\
+        .select('id, name, mbti, password')\
+        .eq('name', name)\
+        .limit(1)\
+        .execute()
+    
+    if response.data and len(response.data) > 0:
+        return response.data[0]
+    return None
+
+def update_password_hash(user_id: int, hashed_password: str, supabase: Client) -> None:
+    """
+    예전 방식으로 저장된 비밀번호 해시를 새 해시로 교체합니다.
     """
     try:
-        hashed_password = hash_password(password)
-        
-        response = supabase.table('users')\
-            .select('id, name, mbti')\
-            .eq('name', name)\
-            .eq('password', hashed_password)\
+        supabase.table('users')\
+            .update({'password': hashed_password})\
+            .eq('id', user_id)\
             .execute()
-        
-        if response.data and len(response.data) > 0:
-            return response.data[0]
-        return None
-        
     except Exception as e:
-        print(f"사용자 인증 실패: {e}")
-        return None
\ No newline at end of file
+        # 다음 로그인 때 다시 시도하면 되므로 로그인은 실패시키지 않습니다.
+        print(f"비밀번호 해시 갱신 실패 > user_id {user_id}: {e}")
@@ -0,0 +1,137 @@
+# benchmarks/bench_course_catalog.py
+"""
+코스 목록 조회 라운드트립 벤치마크
+
+메모리 상의 가짜 Supabase 클라이언트로 execute() 호출 수를 세어
+코스별 경로 조회(N+1) 방식과 load_course_catalog 일괄 조회 방식을 비교합니다.
+
+실행: python -m benchmarks.bench_course_catalog
+"""
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+from app.services.course_service import (
+    COMMON_COURSE_COLOR,
+    _try_order_variants,
+    _try_select_variants,
+    load_course_catalog,
+)
+
+POINTS_PER_COURSE = 3
+
+
+class FakeQuery:
+    def __init__(self, client, table):
+        self.client = client
+        self.rows = list(client.tables[table])
+        self.orders = []
+        self.window = None
+
+    def select(self, *_):
+        return self
+
+    def eq(self, field, value):
+        self.rows = [r for r in self.rows if r.get(field) == value]
+        return self
+
+    def order(self, field, desc=False, **_):
+        self.orders.append((field.strip('"'), desc))
+        return self
+
+    def range(self, start, end):
+        self.window = (start, end)
+        return self
+
+    def execute(self):
+        self.client.round_trips += 1
+        rows = self.rows
+        for field, desc in reversed(self.orders):
+            rows = sorted(rows, key=lambda r: r.get(field), reverse=desc)
+        if self.window:
+            rows = rows[self.window[0]:self.window[1] + 1]
+        return SimpleNamespace(data=rows)
+
+
+class FakeSupabase:
+    def __init__(self, n_courses):
+        self.round_trips = 0
+        self.tables = {
+            'courses': [
+                {'id': i, 'name': f'코스 {i}', 'totalDistance': 1.5}
+                for i in range(1, n_courses + 1)
+            ],
+            'course_paths': [
+                {'id': (i - 1) * POINTS_PER_COURSE + o + 1, 'courseId': i, 'order': o,
+                 'latitude': 35.1 + o * 0.001, 'longitude': 129.0}
+                for i in range(1, n_courses + 1)
+                for o in range(POINTS_PER_COURSE)
+            ],
+        }
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+
+def load_per_course(supabase):
+    """기존 방식: 코스마다 course_paths 를 따로 조회"""
+    select_variants = ['id, name, "totalDistance"', 'id, name, totalDistance', '*']
+    resp = _try_select_variants('courses', supabase, select_variants)
+    courses = []
+    for course in resp.data:
+        paths_resp = _try_order_variants('course_paths', 'latitude, longitude', supabase, course.get('id'))
+        courses.append({
+            'courseId': course.get('id'),
+            'name': course.get('name'),
+            'totalDistance': course.get('totalDistance'),
+            'color': COMMON_COURSE_COLOR,
+            'paths': [
+                {"lat": float(p['latitude']), "lng": float(p['longitude'])}
+                for p in (paths_resp.data if paths_resp else [])
+            ],
+        })
+    return courses
+
+
+def run(loader, n_courses):
+    client = FakeSupabase(n_courses)
+    started = time.perf_counter()
+    courses = loader(client)
+    elapsed = (time.perf_counter() - started) * 1000
+    return client.round_trips, elapsed, courses
+
+
+def measure_memory(build):
+    tracemalloc.start()
+    value = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del value
+    return current
+
+
+def main():
+    print(f"{'courses':>8} {'N+1 calls':>10} {'bulk calls':>11} {'N+1 ms':>9} {'bulk ms':>9}")
+    for n in (10, 100, 300):
+        old_calls, old_ms, old_courses = run(load_per_course, n)
+        new_calls, new_ms, new_courses = run(load_course_catalog, n)
+        new_courses = [c.to_dict() for c in new_courses]
+        assert old_courses == new_courses, "일괄 조회 결과가 기존 결과와 다릅니다."
+        print(f"{n:>8} {old_calls:>10} {new_calls:>11} {old_ms:>9.2f} {new_ms:>9.2f}")
+
+    # 경로가 긴 코스를 캐시에 보관할 때의 메모리 비교 (dict 목록 vs array('d') 레코드)
+    client = FakeSupabase(0)
+    client.tables['courses'] = [{'id': i, 'name': f'코스 {i}', 'totalDistance': 5.0} for i in range(1, 1001)]
+    client.tables['course_paths'] = [
+        {'courseId': i, 'order': o, 'latitude': 35.1 + o * 1e-5, 'longitude': 129.0 + i * 1e-5}
+        for i in range(1, 1001)
+        for o in range(200)
+    ]
+    records = load_course_catalog(client)
+    dict_bytes = measure_memory(lambda: [c.to_dict() for c in records])
+    record_bytes = measure_memory(lambda: load_course_catalog(client))
+    print(f"1000 courses x 200 points: dict paths {dict_bytes / 1e6:.1f} MB, packed records {record_bytes / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
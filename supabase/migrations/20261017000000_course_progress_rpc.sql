@@ -0,0 +1,50 @@
+-- 코스 시작/종료를 한 번의 호출로 처리하는 함수
+-- 코스/사용자 존재 확인과 completed_courses 쓰기를 하나의 트랜잭션에서 수행합니다.
+-- 존재하지 않는 코스/사용자는 SQLSTATE P0002 (no_data_found) 로 알립니다.
+
+create or replace function public.start_course(p_user_id bigint, p_course_id bigint)
+returns void
+language plpgsql
+as $$
+begin
+  if not exists (select 1 from public.courses where id = p_course_id) then
+    raise exception using errcode = 'P0002', message = '존재하지 않는 코스입니다.';
+  end if;
+
+  if not exists (select 1 from public.users where id = p_user_id) then
+    raise exception using errcode = 'P0002', message = '존재하지 않는 사용자입니다.';
+  end if;
+
+  -- 기존 완료 기록 삭제 (있어도 되고 없어도 됨)
+  delete from public.completed_courses
+   where "userId" = p_user_id
+     and "courseId" = p_course_id;
+end;
+$$;
+
+create or replace function public.finish_course(p_user_id bigint, p_course_id bigint)
+returns setof public.completed_courses
+language plpgsql
+as $$
+begin
+  if not exists (select 1 from public.courses where id = p_course_id) then
+    raise exception using errcode = 'P0002', message = '존재하지 않는 코스입니다.';
+  end if;
+
+  if not exists (select 1 from public.users where id = p_user_id) then
+    raise exception using errcode = 'P0002', message = '존재하지 않는 사용자입니다.';
+  end if;
+
+  -- UNIQUE 제약 때문에 중복 시 에러 → start에서 이미 정리됨
+  return query
+    insert into public.completed_courses ("userId", "courseId", completed_at)
+    values (p_user_id, p_course_id, now())
+    returning *;
+end;
+$$;
+
+-- 백엔드(service_role)만 호출합니다. PostgREST 로 anon/authenticated 에게 노출되지 않도록 기본 EXECUTE 권한을 회수합니다.
+revoke execute on function public.start_course(bigint, bigint) from public, anon, authenticated;
+revoke execute on function public.finish_course(bigint, bigint) from public, anon, authenticated;
+grant execute on function public.start_course(bigint, bigint) to service_role;
+grant execute on function public.finish_course(bigint, bigint) to service_role;
@@ -0,0 +1,12 @@
+-- 사용자당 코스별 리뷰는 하나만 허용합니다.
+-- 리뷰 작성/수정/삭제는 사전 조회 없이 이 제약에 기대어 한 번의 쓰기로 처리합니다.
+
+-- 경쟁 상태로 생긴 중복 리뷰가 있다면 가장 최근 것만 남깁니다.
+delete from public.reviews r
+ using public.reviews newer
+ where r."userId" = newer."userId"
+   and r."courseId" = newer."courseId"
+   and r.id < newer.id;
+
+alter table public.reviews
+  add constraint reviews_user_course_key unique ("userId", "courseId");
@@ -0,0 +1,28 @@
+-- 바다 성격 캐시는 (지역, 시간 구간)당 한 행만 유지합니다.
+-- 조회는 (location, bucket) 동등 조건 하나로 끝나고, 저장은 이 키에 대한 upsert 로 처리합니다.
+
+alter table public.sea_emotions
+  add column if not exists bucket timestamp;
+
+-- 기존 행은 cached_at 이 속한 10분 구간으로 채웁니다.
+update public.sea_emotions
+   set bucket = date_trunc('hour', cached_at::timestamp)
+              + floor(extract(minute from cached_at::timestamp) / 10) * interval '10 minutes'
+ where bucket is null;
+
+-- 같은 구간에 여러 행이 있으면 가장 최근 것만 남깁니다.
+delete from public.sea_emotions e
+ using public.sea_emotions newer
+ where e.location = newer.location
+   and e.bucket = newer.bucket
+   and e.id < newer.id;
+
+alter table public.sea_emotions
+  alter column bucket set not null;
+
+create unique index if not exists sea_emotions_location_bucket_key
+  on public.sea_emotions (location, bucket);
+
+-- 보존 기간이 지난 행을 배치로 지울 때 사용합니다.
+create index if not exists sea_emotions_cached_at_idx
+  on public.sea_emotions (cached_at);
@@ -0,0 +1,106 @@
+-- 코스별 리뷰 집계(개수, 평점 합계/분포, 키워드 빈도)를 미리 계산해 두는 테이블
+-- reviews 가 바뀔 때마다 트리거가 증분 갱신하므로 요약 조회는 reviews 를 읽지 않고 이 행 하나만 읽습니다.
+-- 모든 워커가 같은 행을 보므로 다른 워커에서 일어난 쓰기도 바로 반영됩니다.
+
+create table if not exists public.course_review_stats (
+  course_id  bigint primary key,
+  count      integer not null default 0,
+  rating_sum bigint  not null default 0,
+  histogram  jsonb   not null default '{}'::jsonb,  -- 평점 -> 리뷰 수
+  keywords   jsonb   not null default '{}'::jsonb,  -- 키워드 -> 등장 횟수
+  updated_at timestamptz not null default now()
+);
+
+-- 집계는 백엔드(service_role, RLS 우회)와 트리거만 씁니다.
+-- PostgREST 로 anon/authenticated 가 읽거나 고치지 못하도록 RLS 를 켜고(정책 없음) 테이블 권한도 회수합니다.
+alter table public.course_review_stats enable row level security;
+revoke all on table public.course_review_stats from anon, authenticated;
+
+-- 리뷰 한 건을 집계에 더하거나(p_sign = 1) 뺍니다(p_sign = -1).
+-- 키워드는 "바다, 산책" 처럼 쉼표로 구분하며, 0이 된 평점/키워드는 지웁니다.
+create or replace function public.apply_review_stats(p_course_id bigint, p_rating integer, p_keyword text, p_sign integer)
+returns void
+language plpgsql
+as $$
+declare
+  v_rating text := p_rating::text;
+begin
+  insert into public.course_review_stats (course_id)
+  values (p_course_id)
+  on conflict (course_id) do nothing;
+
+  update public.course_review_stats s
+     set count = s.count + p_sign,
+         rating_sum = s.rating_sum + p_sign * p_rating,
+         histogram = case
+           when coalesce((s.histogram ->> v_rating)::int, 0) + p_sign > 0
+             then jsonb_set(s.histogram, array[v_rating], to_jsonb(coalesce((s.histogram ->> v_rating)::int, 0) + p_sign))
+           else s.histogram - v_rating
+         end,
+         keywords = (
+           select coalesce(jsonb_object_agg(k.key, k.total) filter (where k.total > 0), '{}'::jsonb)
+             from (
+               select key, sum(value)::int as total
+                 from (
+                   select key, value::int as value
+                     from jsonb_each_text(s.keywords)
+                   union all
+                   select trim(t), p_sign
+                     from regexp_split_to_table(coalesce(p_keyword, ''), ',') as t
+                    where trim(t) <> ''
+                 ) as changes
+                group by key
+             ) as k
+         ),
+         updated_at = now()
+   where s.course_id = p_course_id;
+end;
+$$;
+
+create or replace function public.reviews_maintain_stats()
+returns trigger
+language plpgsql
+as $$
+begin
+  if tg_op in ('UPDATE', 'DELETE') then
+    perform public.apply_review_stats(old."courseId", old.rating::int, old.keyword, -1);
+  end if;
+  if tg_op in ('INSERT', 'UPDATE') then
+    perform public.apply_review_stats(new."courseId", new.rating::int, new.keyword, 1);
+  end if;
+  return null;
+end;
+$$;
+
+revoke execute on function public.apply_review_stats(bigint, integer, text, integer) from public, anon, authenticated;
+
+drop trigger if exists reviews_maintain_stats on public.reviews;
+create trigger reviews_maintain_stats
+  after insert or update or delete on public.reviews
+  for each row execute function public.reviews_maintain_stats();
+
+-- 기존 리뷰로 집계를 채웁니다.
+insert into public.course_review_stats (course_id, count, rating_sum, histogram, keywords)
+select r."courseId",
+       count(*),
+       sum(r.rating::int),
+       (select jsonb_object_agg(h.rating, h.n)
+          from (select rating::int::text as rating, count(*) as n
+                  from public.reviews
+                 where "courseId" = r."courseId"
+                 group by rating::int) as h),
+       coalesce((select jsonb_object_agg(w.keyword, w.n)
+                   from (select trim(t) as keyword, count(*) as n
+                           from public.reviews rr,
+                                regexp_split_to_table(coalesce(rr.keyword, ''), ',') as t
+                          where rr."courseId" = r."courseId"
+                            and trim(t) <> ''
+                          group by trim(t)) as w), '{}'::jsonb)
+  from public.reviews r
+ group by r."courseId"
+on conflict (course_id) do update
+   set count = excluded.count,
+       rating_sum = excluded.rating_sum,
+       histogram = excluded.histogram,
+       keywords = excluded.keywords,
+       updated_at = now();
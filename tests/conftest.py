@@ -0,0 +1,55 @@
+# tests/conftest.py
+"""
+공용 fixture
+
+pg / migrate: supabase/migrations 의 SQL 을 실제 Postgres 에서 실행해 보는 테스트용 연결
+    - TEST_DATABASE_URL 이 있으면 그 DB를, 없으면 pgserver 로 임시 Postgres 를 띄워 사용합니다.
+    - psycopg 나 Postgres 를 쓸 수 없으면 해당 테스트는 건너뜁니다.
+    - 테스트마다 트랜잭션 안에서 실행하고 끝나면 롤백하므로 DB에 흔적이 남지 않습니다.
+"""
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+MIGRATIONS = ROOT / 'supabase' / 'migrations'
+BASE_SCHEMA = Path(__file__).resolve().parent / 'sql' / 'base_schema.sql'
+
+
+@pytest.fixture(scope='session')
+def pg_url():
+    url = os.getenv('TEST_DATABASE_URL')
+    if url:
+        yield url
+        return
+    pgserver = pytest.importorskip('pgserver', reason='Postgres 없음 (TEST_DATABASE_URL 또는 pgserver 필요)')
+    with tempfile.TemporaryDirectory() as data_dir:
+        try:
+            server = pgserver.get_server(data_dir, cleanup_mode='stop')
+        except Exception as e:
+            pytest.skip(f'임시 Postgres 를 시작할 수 없음: {e}')
+        try:
+            yield server.get_uri()
+        finally:
+            server.cleanup()
+
+
+@pytest.fixture
+def pg(pg_url):
+    psycopg = pytest.importorskip('psycopg', reason='psycopg 필요')
+    with psycopg.connect(pg_url) as conn:
+        conn.execute(BASE_SCHEMA.read_text())
+        try:
+            yield conn
+        finally:
+            conn.rollback()
+
+
+@pytest.fixture
+def migrate(pg):
+    """migrate('파일명.sql') 로 supabase/migrations 의 마이그레이션을 pg 연결에 적용합니다."""
+    def apply(name: str) -> None:
+        pg.execute((MIGRATIONS / name).read_text())
+    return apply
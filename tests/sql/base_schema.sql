@@ -0,0 +1,51 @@
+-- 마이그레이션 테스트용 최소 스키마 (Supabase 프로젝트에 이미 있는 역할/테이블만 흉내 냅니다.)
+do $$
+begin
+  if not exists (select 1 from pg_roles where rolname = 'anon') then
+    create role anon nologin;
+  end if;
+  if not exists (select 1 from pg_roles where rolname = 'authenticated') then
+    create role authenticated nologin;
+  end if;
+  if not exists (select 1 from pg_roles where rolname = 'service_role') then
+    create role service_role nologin bypassrls;
+  end if;
+end;
+$$;
+
+create table public.users (
+  id       bigint generated by default as identity primary key,
+  name     text not null,
+  password text not null,
+  mbti     text
+);
+
+create table public.courses (
+  id   bigint generated by default as identity primary key,
+  name text not null
+);
+
+create table public.completed_courses (
+  id           bigint generated by default as identity primary key,
+  "userId"     bigint not null references public.users (id),
+  "courseId"   bigint not null references public.courses (id),
+  completed_at timestamptz,
+  unique ("userId", "courseId")
+);
+
+create table public.reviews (
+  id         bigint generated by default as identity primary key,
+  "userId"   bigint not null references public.users (id),
+  "courseId" bigint not null references public.courses (id),
+  title      text,
+  keyword    text,
+  rating     integer not null,
+  content    text,
+  created_at timestamptz default now(),
+  updated_at timestamptz
+);
+
+-- Supabase 처럼 public 의 새 테이블/함수에 클라이언트 역할 권한을 기본으로 부여합니다.
+grant usage on schema public to anon, authenticated, service_role;
+alter default privileges in schema public grant all on tables to anon, authenticated, service_role;
+grant all on all tables in schema public to anon, authenticated, service_role;
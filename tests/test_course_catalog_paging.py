@@ -0,0 +1,72 @@
+# tests/test_course_catalog_paging.py
+"""
+코스 카탈로그 일괄 조회가 PostgREST max-rows 제한에 잘리지 않는지 확인합니다.
+"""
+from types import SimpleNamespace
+
+from app.services.course_service import load_course_catalog, reset_dialect_cache
+
+
+class CappedQuery:
+    def __init__(self, client, table):
+        self.client = client
+        self.rows = list(client.tables[table])
+        self.orders = []
+        self.window = None
+
+    def select(self, *_):
+        return self
+
+    def eq(self, field, value):
+        self.rows = [r for r in self.rows if r.get(field) == value]
+        return self
+
+    def in_(self, field, values):
+        self.rows = [r for r in self.rows if r.get(field) in values]
+        return self
+
+    def order(self, field, desc=False, **_):
+        self.orders.append((field.strip('"'), desc))
+        return self
+
+    def range(self, start, end):
+        self.window = (start, end)
+        return self
+
+    def execute(self):
+        self.client.round_trips += 1
+        rows = self.rows
+        for field, desc in reversed(self.orders):
+            rows = sorted(rows, key=lambda r: r[field], reverse=desc)
+        start, end = self.window or (0, len(rows) - 1)
+        # 서버 max-rows: 요청한 범위와 상관없이 max_rows 행까지만 반환
+        return SimpleNamespace(data=rows[start:min(end + 1, start + self.client.max_rows)])
+
+
+class CappedSupabase:
+    def __init__(self, n_courses, points_per_course, max_rows):
+        self.max_rows = max_rows
+        self.round_trips = 0
+        self.tables = {
+            'courses': [{'id': i, 'name': f'코스 {i}', 'totalDistance': 1.0, 'created_at': None}
+                        for i in range(n_courses, 0, -1)],
+            'course_paths': [
+                {'id': (i - 1) * points_per_course + o + 1, 'courseId': i, 'order': o,
+                 'latitude': 35.0 + o, 'longitude': 129.0}
+                for i in range(1, n_courses + 1)
+                for o in range(points_per_course)
+            ],
+        }
+
+    def table(self, name):
+        return CappedQuery(self, name)
+
+
+def test_catalog_is_not_truncated_by_max_rows():
+    reset_dialect_cache()
+    supabase = CappedSupabase(n_courses=25, points_per_course=3, max_rows=7)
+    courses = load_course_catalog(supabase, page_size=10)
+
+    assert sorted(c.course_id for c in courses) == list(range(1, 26))
+    for course in courses:
+        assert list(course.coords) == [35.0, 129.0, 36.0, 129.0, 37.0, 129.0]
@@ -0,0 +1,51 @@
+# tests/test_course_catalog_refresh.py
+"""
+카탈로그에 없는 코스를 반복 조회해도 카탈로그를 매번 버리지 않고, 갱신 빈도가 제한되는지 확인합니다.
+"""
+import time
+from array import array
+
+from app.core.cache import SnapshotCache
+from app.services import course_service
+from app.services.course_service import CourseCatalog, CourseRecord, get_course_by_id_service
+
+
+def _record(course_id):
+    return CourseRecord.from_row({'id': course_id, 'name': f'코스 {course_id}'}, array('d'))
+
+
+def test_missing_course_does_not_drop_catalog(monkeypatch):
+    loads = []
+
+    def loader(supabase):
+        loads.append(time.monotonic())
+        return CourseCatalog([_record(1)])
+
+    catalog = SnapshotCache('test_catalog', loader, ttl_seconds=300)
+    monkeypatch.setattr(course_service, '_course_catalog', catalog)
+    monkeypatch.setattr(course_service, '_fetch_course_by_id', lambda course_id, supabase: _record(course_id))
+    monkeypatch.setattr(course_service.settings, 'COURSE_CATALOG_MIN_REFRESH_SECONDS', 60)
+
+    for _ in range(20):
+        assert get_course_by_id_service(2, None)['courseId'] == 2
+
+    # 처음 한 번만 불러오고, 스냅샷이 최소 간격보다 새것이므로 다시 불러오지 않습니다.
+    assert len(loads) == 1
+    assert catalog.stats()['version'] == 1
+
+
+def test_refresh_if_older_than_runs_in_background():
+    loads = []
+    catalog = SnapshotCache('test_catalog', lambda: loads.append(1) or len(loads), ttl_seconds=300)
+    first = catalog.get()
+
+    assert catalog.refresh_if_older_than(60) is False
+    assert catalog.refresh_if_older_than(0) is True
+    # 갱신이 끝나기 전에도 기존 스냅샷을 그대로 반환합니다.
+    assert catalog.get().version >= first.version
+
+    for _ in range(100):
+        if catalog.stats()['refreshes']:
+            break
+        time.sleep(0.01)
+    assert catalog.get().value == 2
@@ -0,0 +1,103 @@
+# tests/test_course_progress_rpc.py
+"""
+코스 시작/종료가 DB 함수(rpc) 한 번의 호출로 처리되는지 확인합니다.
+여기서는 서비스/라우트 쪽(호출 횟수, 오류 변환)만 가짜 클라이언트로 확인하고,
+DB 함수 자체는 test_course_progress_sql.py 에서 실제 Postgres 로 실행해 확인합니다.
+"""
+import pytest
+from fastapi.testclient import TestClient
+from postgrest.exceptions import APIError
+
+from app.main import app
+from app.core.supabase_client import get_supabase
+from app.services.course_service import finish_course_service, start_course_service
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+
+class FakeRpc:
+    def __init__(self, client, name, params):
+        self.client = client
+        self.name = name
+        self.params = params
+
+    def execute(self):
+        error = self.client.errors.get(self.name)
+        if error is not None:
+            raise error
+        if self.name == 'finish_course':
+            return FakeResponse([{'userId': self.params['p_user_id'], 'courseId': self.params['p_course_id']}])
+        return FakeResponse([])
+
+
+class FakeSupabase:
+    """rpc/table 호출을 기록하는 Supabase 대역"""
+
+    def __init__(self, errors=None):
+        self.errors = errors or {}
+        self.rpc_calls = []
+        self.table_calls = []
+
+    def rpc(self, name, params):
+        self.rpc_calls.append((name, params))
+        return FakeRpc(self, name, params)
+
+    def table(self, name):
+        self.table_calls.append(name)
+        raise AssertionError(f"unexpected table() call: {name}")
+
+
+def _not_found(message):
+    return APIError({'code': 'P0002', 'message': message, 'details': None, 'hint': None})
+
+
+def test_start_course_is_single_rpc():
+    supabase = FakeSupabase()
+    start_course_service(1, 2, supabase)
+    assert supabase.rpc_calls == [('start_course', {'p_user_id': 1, 'p_course_id': 2})]
+    assert supabase.table_calls == []
+
+
+def test_finish_course_is_single_rpc():
+    supabase = FakeSupabase()
+    row = finish_course_service(1, 2, supabase)
+    assert row == {'userId': 1, 'courseId': 2}
+    assert supabase.rpc_calls == [('finish_course', {'p_user_id': 1, 'p_course_id': 2})]
+    assert supabase.table_calls == []
+
+
+@pytest.mark.parametrize('service, rpc_name', [
+    (start_course_service, 'start_course'),
+    (finish_course_service, 'finish_course'),
+])
+def test_not_found_becomes_value_error(service, rpc_name):
+    supabase = FakeSupabase(errors={rpc_name: _not_found('존재하지 않는 코스입니다.')})
+    with pytest.raises(ValueError, match='존재하지 않는 코스입니다.'):
+        service(1, 2, supabase)
+    assert len(supabase.rpc_calls) == 1
+
+
+def test_other_errors_are_not_mapped():
+    supabase = FakeSupabase(errors={'start_course': APIError({'code': '42501', 'message': 'denied'})})
+    with pytest.raises(APIError):
+        start_course_service(1, 2, supabase)
+
+
+@pytest.mark.parametrize('action', ['start', 'finish'])
+def test_route_maps_not_found_to_404(action):
+    supabase = FakeSupabase(errors={
+        'start_course': _not_found('존재하지 않는 사용자입니다.'),
+        'finish_course': _not_found('존재하지 않는 사용자입니다.'),
+    })
+    app.dependency_overrides[get_supabase] = lambda: supabase
+    try:
+        response = TestClient(app).post(f'/api/courses/2/1/{action}')
+    finally:
+        app.dependency_overrides.pop(get_supabase, None)
+    assert response.status_code == 404
+    assert response.json()['detail'] == '존재하지 않는 사용자입니다.'
+    assert len(supabase.rpc_calls) == 1
+    assert supabase.table_calls == []
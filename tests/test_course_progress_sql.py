@@ -0,0 +1,66 @@
+# tests/test_course_progress_sql.py
+"""
+start_course / finish_course DB 함수를 실제 Postgres 에서 실행해 확인합니다. (Postgres 가 없으면 건너뜀)
+"""
+import pytest
+
+psycopg = pytest.importorskip('psycopg')
+
+MIGRATION = '20261017000000_course_progress_rpc.sql'
+
+
+@pytest.fixture
+def ids(pg, migrate):
+    migrate(MIGRATION)
+    user_id = pg.execute("insert into users (name, password) values ('u', 'p') returning id").fetchone()[0]
+    course_id = pg.execute("insert into courses (name) values ('c') returning id").fetchone()[0]
+    return user_id, course_id
+
+
+def _completed(pg, user_id, course_id):
+    return pg.execute(
+        'select count(*) from completed_courses where "userId" = %s and "courseId" = %s', (user_id, course_id)
+    ).fetchone()[0]
+
+
+def test_finish_then_start_round_trip(pg, ids):
+    user_id, course_id = ids
+    rows = pg.execute('select "userId", "courseId", completed_at from finish_course(%s, %s)', ids).fetchall()
+    assert len(rows) == 1 and rows[0][:2] == (user_id, course_id) and rows[0][2] is not None
+    assert _completed(pg, user_id, course_id) == 1
+
+    pg.execute('select start_course(%s, %s)', ids)
+    assert _completed(pg, user_id, course_id) == 0
+
+    # 기록이 없어도 start 는 성공하고, 다시 finish 할 수 있습니다.
+    pg.execute('select start_course(%s, %s)', ids)
+    pg.execute('select * from finish_course(%s, %s)', ids)
+    assert _completed(pg, user_id, course_id) == 1
+
+
+@pytest.mark.parametrize('fn', ['start_course', 'finish_course'])
+@pytest.mark.parametrize('missing, message', [('course', '존재하지 않는 코스입니다.'), ('user', '존재하지 않는 사용자입니다.')])
+def test_missing_rows_raise_no_data_found(pg, ids, fn, missing, message):
+    user_id, course_id = ids
+    args = (user_id, -1) if missing == 'course' else (-1, course_id)
+    pg.execute('savepoint s')
+    with pytest.raises(psycopg.errors.NoDataFound, match=message) as exc:
+        pg.execute(f'select * from {fn}(%s, %s)', args)
+    assert exc.value.sqlstate == 'P0002'
+    pg.execute('rollback to savepoint s')
+
+
+@pytest.mark.parametrize('role', ['anon', 'authenticated'])
+def test_client_roles_cannot_execute(pg, ids, role):
+    pg.execute(f'set local role {role}')
+    pg.execute('savepoint s')
+    with pytest.raises(psycopg.errors.InsufficientPrivilege):
+        pg.execute('select start_course(%s, %s)', ids)
+    pg.execute('rollback to savepoint s')
+    pg.execute('reset role')
+
+
+def test_service_role_can_execute(pg, ids):
+    pg.execute('set local role service_role')
+    pg.execute('select * from finish_course(%s, %s)', ids)
+    pg.execute('reset role')
@@ -0,0 +1,85 @@
+# tests/test_course_review_stats_sql.py
+"""
+reviews 트리거가 course_review_stats 를 증분 유지하는지, 클라이언트 역할이 집계에 접근할 수 없는지
+실제 Postgres 에서 확인합니다. (Postgres 가 없으면 건너뜀)
+"""
+import pytest
+
+psycopg = pytest.importorskip('psycopg')
+
+MIGRATIONS = ['20261017000100_reviews_unique_user_course.sql', '20261017000300_course_review_stats.sql']
+
+
+@pytest.fixture
+def course(pg, migrate):
+    for name in MIGRATIONS:
+        migrate(name)
+    users = [pg.execute("insert into users (name, password) values (%s, 'p') returning id", (f'u{i}',)).fetchone()[0]
+             for i in range(3)]
+    course_id = pg.execute("insert into courses (name) values ('c') returning id").fetchone()[0]
+    return course_id, users
+
+
+def _stats(pg, course_id):
+    row = pg.execute(
+        'select count, rating_sum, histogram, keywords from course_review_stats where course_id = %s', (course_id,)
+    ).fetchone()
+    return row and {'count': row[0], 'rating_sum': row[1], 'histogram': row[2], 'keywords': row[3]}
+
+
+def _review(pg, user_id, course_id, rating, keyword):
+    pg.execute('insert into reviews ("userId", "courseId", rating, keyword) values (%s, %s, %s, %s)',
+               (user_id, course_id, rating, keyword))
+
+
+def test_trigger_maintains_aggregates(pg, course):
+    course_id, (u1, u2, u3) = course
+    _review(pg, u1, course_id, 5, '바다, 산책')
+    _review(pg, u2, course_id, 3, '바다')
+    _review(pg, u3, course_id, 5, None)
+    assert _stats(pg, course_id) == {
+        'count': 3, 'rating_sum': 13, 'histogram': {'5': 2, '3': 1}, 'keywords': {'바다': 2, '산책': 1},
+    }
+
+    pg.execute('update reviews set rating = 4, keyword = %s where "userId" = %s', ('노을', u2))
+    assert _stats(pg, course_id) == {
+        'count': 3, 'rating_sum': 14, 'histogram': {'5': 2, '4': 1}, 'keywords': {'바다': 1, '산책': 1, '노을': 1},
+    }
+
+    pg.execute('delete from reviews where "userId" in (%s, %s)', (u1, u3))
+    assert _stats(pg, course_id) == {'count': 1, 'rating_sum': 4, 'histogram': {'4': 1}, 'keywords': {'노을': 1}}
+
+
+def test_backfill_matches_trigger(pg, migrate, course):
+    course_id, (u1, u2, _) = course
+    _review(pg, u1, course_id, 2, 'a, b')
+    _review(pg, u2, course_id, 4, 'b')
+    expected = _stats(pg, course_id)
+
+    pg.execute('delete from course_review_stats')
+    migrate(MIGRATIONS[1])
+    assert _stats(pg, course_id) == expected
+
+
+@pytest.mark.parametrize('role', ['anon', 'authenticated'])
+def test_client_roles_cannot_touch_aggregates(pg, course, role):
+    course_id, (u1, _, _) = course
+    _review(pg, u1, course_id, 5, None)
+    pg.execute(f'set local role {role}')
+    for sql in ('select * from course_review_stats',
+                'update course_review_stats set count = 0',
+                'delete from course_review_stats'):
+        pg.execute('savepoint s')
+        with pytest.raises(psycopg.errors.InsufficientPrivilege):
+            pg.execute(sql)
+        pg.execute('rollback to savepoint s')
+    pg.execute('reset role')
+    assert _stats(pg, course_id)['count'] == 1
+
+
+def test_service_role_reads_aggregates(pg, course):
+    course_id, (u1, _, _) = course
+    _review(pg, u1, course_id, 5, None)
+    pg.execute('set local role service_role')
+    assert _stats(pg, course_id)['count'] == 1
+    pg.execute('reset role')
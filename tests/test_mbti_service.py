@@ -0,0 +1,100 @@
+# tests/test_mbti_service.py
+"""
+MBTI 저장이 기존 사용자는 update 한 번으로 끝내고(NOT NULL 컬럼을 건드리는 upsert 없이),
+없는 사용자만 insert 하며, 결과를 프로필 캐시에 반영하는지 확인합니다.
+"""
+import pytest
+
+from app.services import mbti_service
+from app.services.mbti_service import get_mbti_service, save_mbti_service
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+
+class FakeQuery:
+    def __init__(self, client, table):
+        self.client = client
+        self.table = table
+        self.op = None
+        self.payload = None
+        self.filters = {}
+
+    def update(self, payload):
+        self.op, self.payload = 'update', payload
+        return self
+
+    def insert(self, payload):
+        self.op, self.payload = 'insert', payload
+        return self
+
+    def select(self, columns):
+        self.op = 'select'
+        return self
+
+    def eq(self, column, value):
+        self.filters[column] = value
+        return self
+
+    def execute(self):
+        self.client.calls.append(self.op)
+        users = self.client.users
+        if self.op == 'update':
+            user = users.get(self.filters['id'])
+            if user is None:
+                return FakeResponse([])
+            user.update(self.payload)
+            return FakeResponse([dict(user)])
+        if self.op == 'insert':
+            if self.client.insert_error is not None:
+                raise self.client.insert_error
+            users[self.payload['id']] = dict(self.payload)
+            return FakeResponse([dict(self.payload)])
+        user = users.get(self.filters['id'])
+        return FakeResponse([dict(user)] if user else [])
+
+
+class FakeSupabase:
+    def __init__(self, users=None, insert_error=None):
+        self.users = users or {}
+        self.insert_error = insert_error
+        self.calls = []
+
+    def table(self, name):
+        assert name == 'users'
+        return FakeQuery(self, name)
+
+
+@pytest.fixture(autouse=True)
+def clear_profiles():
+    mbti_service.user_profiles.clear()
+    yield
+    mbti_service.user_profiles.clear()
+
+
+def test_existing_user_is_updated_without_insert():
+    supabase = FakeSupabase({1: {'id': 1, 'name': 'a', 'password': 'p', 'mbti': 'ISTJ'}})
+    assert save_mbti_service(1, 'ENFP', supabase)['mbti'] == 'ENFP'
+    assert supabase.calls == ['update']
+    assert supabase.users[1]['name'] == 'a'
+
+    # 저장한 값이 캐시에 들어가 조회 시 DB를 다시 읽지 않습니다.
+    assert get_mbti_service(1, supabase) == 'ENFP'
+    assert supabase.calls == ['update']
+
+
+def test_missing_user_is_inserted():
+    supabase = FakeSupabase()
+    assert save_mbti_service(2, 'INTP', supabase)['mbti'] == 'INTP'
+    assert supabase.calls == ['update', 'insert']
+
+
+def test_failed_save_drops_cached_profile():
+    supabase = FakeSupabase(insert_error=RuntimeError('23502'))
+    mbti_service.user_profiles.set(3, {'mbti': 'ISTJ'})
+    with pytest.raises(RuntimeError):
+        save_mbti_service(3, 'INTP', supabase)
+    assert get_mbti_service(3, supabase) is None
+    assert supabase.calls == ['update', 'insert', 'select']
@@ -0,0 +1,48 @@
+# tests/test_password_hashing.py
+"""
+비밀번호 검증: 예전 sha256 해시 호환, bcrypt 재해시, 없는 사용자도 같은 비용으로 검증하는지 확인합니다.
+"""
+import hashlib
+
+import pytest
+
+from app.services import user_service
+from app.services.user_service import hash_password, verify_password
+
+
+@pytest.fixture
+def bcrypt_calls(monkeypatch):
+    """pwd_context 의 bcrypt 검증 횟수를 셉니다."""
+    calls = []
+    original = user_service.pwd_context.verify
+
+    def verify(secret, hashed, *args, **kwargs):
+        if user_service.pwd_context.identify(hashed) == 'bcrypt':
+            calls.append(hashed)
+        return original(secret, hashed, *args, **kwargs)
+
+    monkeypatch.setattr(user_service.pwd_context, 'verify', verify)
+    return calls
+
+
+def test_bcrypt_round_trip(bcrypt_calls):
+    hashed = hash_password('secret')
+    assert hashed.startswith('$2')
+    assert verify_password('secret', hashed) == (True, None)
+    assert verify_password('wrong', hashed) == (False, None)
+
+
+def test_legacy_sha256_verifies_and_upgrades(bcrypt_calls):
+    legacy = hashlib.sha256(b'secret').hexdigest()
+    verified, new_hash = verify_password('secret', legacy)
+    assert verified
+    assert new_hash is not None and new_hash.startswith('$2')
+    assert verify_password('wrong', legacy) == (False, None)
+    # 예전 해시도 bcrypt 와 같은 비용으로 검증합니다.
+    assert len(bcrypt_calls) == 2
+
+
+@pytest.mark.parametrize('stored', [None, '', 'not-a-hash'])
+def test_missing_or_unknown_hash_still_runs_bcrypt(bcrypt_calls, stored):
+    assert verify_password('secret', stored) == (False, None)
+    assert bcrypt_calls == [user_service._dummy_hash()]
@@ -0,0 +1,34 @@
+# tests/test_quiz_batches.py
+"""
+세션별 퀴즈 묶음이 한 바퀴 안에서 겹치지 않고, 바퀴가 넘어갈 때 남은 퀴즈를 다시 미루지 않는지 확인합니다.
+"""
+from app.services.quiz_service import SeenQuizStore
+
+
+def test_no_repeats_within_a_round():
+    store = SeenQuizStore(max_sessions=10)
+    seen = []
+    for _ in range(4):
+        seen += store.pick('s', version=1, size=12, n=3)
+    assert sorted(seen) == list(range(12))
+
+
+def test_wraparound_only_marks_fill_quizzes():
+    store = SeenQuizStore(max_sessions=10)
+    first = store.pick('s', version=1, size=5, n=3)
+    second = store.pick('s', version=1, size=5, n=3)
+    leftovers = second[:2]
+    fill = second[2:]
+    assert sorted(first + leftovers) == list(range(5))
+    assert len(fill) == 1 and fill[0] not in leftovers
+
+    # 새 바퀴에서는 채운 퀴즈만 본 것이므로 지난 바퀴의 나머지도 다시 나올 수 있어야 합니다.
+    third = store.pick('s', version=1, size=5, n=4)
+    assert fill[0] not in third
+    assert sorted(third) == sorted(set(range(5)) - set(fill))
+
+
+def test_pool_version_change_resets_session():
+    store = SeenQuizStore(max_sessions=10)
+    store.pick('s', version=1, size=3, n=3)
+    assert sorted(store.pick('s', version=2, size=3, n=3)) == [0, 1, 2]
@@ -0,0 +1,99 @@
+# tests/test_sea_emotion_cache.py
+"""
+바다 성격 캐시: 미스 한 번의 DB 왕복 수와 지역별 single-flight 를 확인합니다.
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.core import executor
+from app.core.cache import AsyncSingleFlight
+from app.core.executor import BoundedExecutor
+from app.services import seamotion_service
+from app.services.seamotion_service import SeaEmotionCache, get_sea_emotion_service
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    counts = {'select': 0, 'save': 0, 'fetch': 0}
+    release = threading.Event()
+    release.set()
+
+    def get_cached_emotion(location, supabase, bucket=None):
+        counts['select'] += 1
+        return None
+
+    def save_emotion_cache(location, emotion_data, sea_data, supabase, bucket=None):
+        counts['save'] += 1
+        return True
+
+    def get_sea_data(location, api_key):
+        counts['fetch'] += 1
+        assert release.wait(5)
+        time.sleep(0.05)
+        return {"wavesHeight": 1.2, "windSpeed": 8.5, "watertemperature": 18.74}
+
+    monkeypatch.setattr(seamotion_service, 'sea_emotion_cache', SeaEmotionCache(100, 600, {}))
+    monkeypatch.setattr(seamotion_service, 'sea_emotion_flight', AsyncSingleFlight('test'))
+    monkeypatch.setattr(seamotion_service, 'get_cached_emotion', get_cached_emotion)
+    monkeypatch.setattr(seamotion_service, 'save_emotion_cache', save_emotion_cache)
+    monkeypatch.setattr(seamotion_service, 'get_sea_data', get_sea_data)
+    counts['release'] = release
+    return counts
+
+
+def test_miss_costs_one_select_and_one_write(calls):
+    result = asyncio.run(get_sea_emotion_service('해운대', 'key', None))
+    assert result['name'] == '서퍼의 바다'
+    assert (calls['select'], calls['save'], calls['fetch']) == (1, 1, 1)
+
+    stats = seamotion_service.sea_emotion_cache.stats()
+    assert stats['db'] == {'hits': 0, 'misses': 1, 'hit_rate': 0.0}
+    assert (stats['memory']['hits'], stats['memory']['misses']) == (0, 1)
+
+    # 두 번째 요청은 메모리에서 끝납니다.
+    assert asyncio.run(get_sea_emotion_service('해운대', 'key', None)) == result
+    assert (calls['select'], calls['save'], calls['fetch']) == (1, 1, 1)
+
+
+def test_concurrent_misses_are_coalesced(calls):
+    async def main():
+        return await asyncio.gather(*(get_sea_emotion_service('광안리', 'key', None) for _ in range(10)))
+
+    results = asyncio.run(main())
+    assert all(r == results[0] for r in results)
+    assert calls['fetch'] == 1
+    assert calls['save'] == 1
+    flight = seamotion_service.sea_emotion_flight.stats()
+    assert flight['executions'] == 1
+    assert flight['calls'] == flight['executions'] + flight['coalesced']
+    assert flight['in_flight'] == 0
+
+
+def test_waiters_do_not_hold_db_threads(calls, monkeypatch):
+    # DB 풀이 작아도 leader 한 건만 스레드를 쓰고, 나머지는 이벤트 루프에서 기다려야 합니다.
+    pool = BoundedExecutor('test-db', 2)
+    monkeypatch.setattr(executor, 'db_executor', pool)
+    calls['release'].clear()
+    flight = seamotion_service.sea_emotion_flight
+
+    async def main():
+        requests = [asyncio.ensure_future(get_sea_emotion_service('송정', 'key', None)) for _ in range(20)]
+        async def all_waiting():
+            while flight.coalesced < 19:
+                await asyncio.sleep(0.01)
+        await asyncio.wait_for(all_waiting(), 5)
+        assert pool.stats()['active'] == 1
+        assert pool.stats()['queued'] == 0
+        calls['release'].set()
+        return await asyncio.gather(*requests)
+
+    try:
+        results = asyncio.run(main())
+    finally:
+        calls['release'].set()
+        pool.shutdown()
+    assert len(results) == 20
+    assert calls['fetch'] == 1
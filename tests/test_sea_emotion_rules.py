@@ -0,0 +1,195 @@
+# tests/test_sea_emotion_rules.py
+"""
+SEA_EMOTION_RULES 결정표가 예전 if 사다리와 같은 결과를 내는지 확인하는 속성 테스트
+한 건 분류(analyze_sea_emotion)와 배열 일괄 분류(analyze_sea_emotions) 모두 비교합니다.
+"""
+import itertools
+import math
+import random
+
+import numpy as np
+import pytest
+
+from app.services.seamotion_service import SEA_EMOTION_RULES, analyze_sea_emotion, analyze_sea_emotions
+
+
+def legacy_analyze_sea_emotion(sea_data: dict) -> dict:
+    """
+    결정표로 바꾸기 전의 if 사다리 (수정하지 말 것)
+    """
+    waves = sea_data.get("wavesHeight", 1.0)
+    wind = sea_data.get("windSpeed", 8.0)
+    temperature = sea_data.get("watertemperature", 18.0)
+    
+    # 바다 상태에 따른 감정 분류
+     # 1. 잠든 바다
+    if waves < 0.3 and wind < 3:
+        return {
+            "emotion": "😴",
+            "name": "잠든 바다",
+            "message": "거울처럼 고요해요. 명상하기 완벽한 날이에요"
+        }
+    
+    # 2. 천국 같은 바다
+    if temperature > 25 and waves < 0.5 and wind < 5:
+        return {
+            "emotion": "🏖️",
+            "name": "천국 같은 바다",
+            "message": "물놀이 최적의 조건이에요! 수영 Go Go!"
+        }
+    
+    # 3. 평온한 바다
+    if waves < 0.5 and wind < 5 and temperature > 20:
+        return {
+            "emotion": "🫧",
+            "name": "평온한 바다",
+            "message": "산책하기 좋은 날이에요"
+        }
+    
+    # 4. 상쾌한 바다
+    if waves < 0.8 and wind < 7 and temperature > 18:
+        return {
+            "emotion": "☀️",
+            "name": "상쾌한 바다",
+            "message": "수영하기 딱 좋은 날씨예요"
+        }
+    
+    # 5. 화창한 바다
+    if waves < 1.0 and wind < 8 and temperature > 17:
+        return {
+            "emotion": "🔅",
+            "name": "화창한 바다",
+            "message": "해양 스포츠 즐기기 좋은 날이에요"
+        }
+    
+    # 6. 서퍼의 바다
+    if waves >= 1.2 and waves < 2.0 and wind < 10:
+        return {
+            "emotion": "🏄",
+            "name": "서퍼의 바다",
+            "message": "파도타기 최고의 컨디션이에요!"
+        }
+    
+    # 7. 활기찬 바다
+    if waves < 1.5 and wind < 10:
+        return {
+            "emotion": "🌊",
+            "name": "활기찬 바다",
+            "message": "파도가 살아있어요. 물놀이 조심하세요"
+        }
+    
+    # 8. 바람부는 바다
+    if wind >= 12 and wind < 15 and waves < 1.5:
+        return {
+            "emotion": "💨",
+            "name": "바람부는 바다",
+            "message": "연날리기 좋은 날이에요. 모자 단단히 잡으세요!"
+        }
+    
+    # 9. 들뜬 바다
+    if waves < 2.0 and wind < 12:
+        return {
+            "emotion": "🌀",
+            "name": "들뜬 바다",
+            "message": "바람이 제법 불어요. 주의하며 즐기세요"
+        }
+    
+    # 10. 차가운 바다
+    if temperature < 15 and waves < 1.5:
+        return {
+            "emotion": "❄️",
+            "name": "차가운 바다",
+            "message": "겨울 바다의 고요함. 따뜻하게 입고 산책하세요"
+        }
+    
+    # 11. 흥분한 바다
+    if waves < 2.5 and wind < 15:
+        return {
+            "emotion": "〰️",
+            "name": "흥분한 바다",
+            "message": "파도가 높아요. 해변가에서만 활동하세요"
+        }
+    
+    # 12. 거친 바다
+    if waves < 3.0 and wind < 18:
+        return {
+            "emotion": "💪",
+            "name": "거친 바다",
+            "message": "안전에 주의하세요. 입수는 위험해요"
+        }
+    
+    # 13. 험한 바다
+    if waves < 3.5 and wind < 20:
+        return {
+            "emotion": "⚠️",
+            "name": "험한 바다",
+            "message": "물놀이 금지! 해변 산책 정도만 권장해요"
+        }
+    
+    # 14. 성난 바다
+    if waves < 4.0 or wind < 25:
+        return {
+            "emotion": "⛈️",
+            "name": "성난 바다",
+            "message": "입수 금지! 해변에서도 안전거리를 유지하세요"
+        }
+    
+    # 15. 광폭한 바다 (그 외 모든 경우)
+    return {
+        "emotion": "🌊⚡",
+        "name": "광폭한 바다",
+        "message": "매우 위험해요. 해안가 접근을 자제하세요"
+    }
+
+
+def _thresholds(field):
+    return sorted({threshold for conditions, _ in SEA_EMOTION_RULES
+                   for name, _, threshold in conditions if name == field})
+
+
+def _around(values):
+    """각 기준값과 그 바로 아래/위, NaN, 범위 밖 값"""
+    points = [v + d for v in values for d in (-1e-9, 0.0, 1e-9)]
+    return points + [math.nan, -1.0, 0.0, 100.0]
+
+
+def _threshold_samples():
+    return list(itertools.product(
+        _around(_thresholds('waves')),
+        _around(_thresholds('wind')),
+        _around(_thresholds('temperature')),
+    ))
+
+
+def _random_samples(n, seed=20261017):
+    rng = random.Random(seed)
+    return [(rng.uniform(-1, 6), rng.uniform(-1, 40), rng.uniform(-5, 35)) for _ in range(n)]
+
+
+def _sea_data(waves, wind, temperature):
+    return {"wavesHeight": waves, "windSpeed": wind, "watertemperature": temperature}
+
+
+@pytest.mark.parametrize('samples', [_threshold_samples(), _random_samples(20000)], ids=['thresholds', 'random'])
+def test_scalar_matches_legacy_ladder(samples):
+    for sample in samples:
+        data = _sea_data(*sample)
+        assert analyze_sea_emotion(data) == legacy_analyze_sea_emotion(data), sample
+
+
+@pytest.mark.parametrize('samples', [_threshold_samples(), _random_samples(20000)], ids=['thresholds', 'random'])
+def test_batch_matches_legacy_ladder(samples):
+    readings = np.array(samples, dtype=float)
+    results = analyze_sea_emotions(readings[:, 0], readings[:, 1], readings[:, 2])
+    assert len(results) == len(samples)
+    for sample, result in zip(samples, results):
+        assert result == legacy_analyze_sea_emotion(_sea_data(*sample)), sample
+
+
+def test_missing_readings_use_defaults():
+    assert analyze_sea_emotion({}) == legacy_analyze_sea_emotion({})
+
+
+def test_batch_broadcasts_scalars():
+    results = analyze_sea_emotions([0.1, 5.0], 2.0, 20.0)
+    assert results == [legacy_analyze_sea_emotion(_sea_data(w, 2.0, 20.0)) for w in (0.1, 5.0)]